@@ -1,2 +1,2 @@
 # Config package
-from .settings import DatabaseConfig
\ No newline at end of file
+from .settings import get_db_config
\ No newline at end of file
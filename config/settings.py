@@ -1,11 +1,37 @@
 import os
+from dataclasses import dataclass
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
-load_dotenv()
 
-class DatabaseConfig:
-    HOST = os.getenv('DB_HOST','localhost')
-    PORT = int(os.getenv('DB_PORT',3306))
-    USER = os.getenv('DB_USER','root')
-    PASSWORD = os.getenv('DB_PASS','')
-    DATABASE = os.getenv('DB_NAME','SeekIT')
+@dataclass(frozen=True, slots=True)
+class _DBConfig:
+    """Immutable snapshot of the database settings."""
+
+    HOST: str
+    PORT: int
+    USER: str
+    PASSWORD: str
+    DATABASE: str
+
+
+@lru_cache(maxsize=1)
+def _load_env_once():
+    """Parse the .env file a single time per process"""
+    load_dotenv()
+    return True
+
+
+@lru_cache(maxsize=1)
+def get_db_config():
+    """Return the cached database settings"""
+    _load_env_once()
+
+    return _DBConfig(
+        HOST=os.getenv('DB_HOST','localhost'),
+        PORT=int(os.getenv('DB_PORT',3306)),
+        USER=os.getenv('DB_USER','root'),
+        PASSWORD=os.getenv('DB_PASS',''),
+        DATABASE=os.getenv('DB_NAME','SeekIT'),
+    )
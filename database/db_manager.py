@@ -1,49 +1,226 @@
-import mysql.connector
-from mysql.connector import Error
+import logging
+import queue
+import threading
+import time
+
 from contextlib import contextmanager
-from config import DatabaseConfig
+from config import get_db_config
+
+logger = logging.getLogger(__name__)
+
+_cfg = get_db_config()
+HOST = _cfg.HOST
+PORT = _cfg.PORT
+USER = _cfg.USER
+PASSWORD = _cfg.PASSWORD
+DATABASE = _cfg.DATABASE
+
+# Maximum number of idle connections kept around for reuse
+POOL_SIZE = 5
+
+# Connections older than this many seconds are replaced instead of reused,
+# so the server's wait_timeout never closes one under us
+POOL_RECYCLE = 3600
+
+# MySQL error number for a row that collides with a unique key
+ER_DUP_ENTRY = 1062
+
+# Session settings applied once to every new connection
+SESSION_SETUP = (
+    "SET SESSION TRANSACTION ISOLATION LEVEL READ COMMITTED",
+)
+
+
+def _driver():
+    """Import the MySQL driver on first use so importing this module stays cheap"""
+    import mysql.connector
+    return mysql.connector
+
 
 class DatabaseManager:
-    __connection = None
+    # Placeholder style expected by the driver in parameterized queries
+    PARAM = "%s"
+
+    __pool = queue.LifoQueue(maxsize=POOL_SIZE)
+    __local = threading.local()
+
+    @staticmethod
+    def is_duplicate_key(error):
+        """True when a driver error was caused by a unique key collision"""
+        return getattr(error, 'errno', None) == ER_DUP_ENTRY
 
     @classmethod
     def get_connection(cls):
-        """Get or create a database connection"""
-        if cls.__connection is None or not cls.__connection.is_connected():
+        """Open a new database connection"""
+        driver = _driver()
+        try:
+            connection = driver.connect(
+                host=HOST,
+                port=PORT,
+                user=USER,
+                password=PASSWORD,
+                database=DATABASE
+            )
+            cursor = connection.cursor()
+            for statement in SESSION_SETUP:
+                cursor.execute(statement)
+            cursor.close()
+            logger.debug("Database connection established")
+        except driver.Error as e:
+            raise ConnectionError(f"Could not connect to database: {e}") from e
+        return connection
+
+    @classmethod
+    def _checkout(cls):
+        """Borrow a pooled connection for the current thread.
+
+        Nested calls on the same thread share the connection that is already
+        checked out, so inner helpers stay in the caller's transaction.
+        """
+        local = cls.__local
+        if getattr(local, 'depth', 0):
+            local.depth += 1
+            return local.connection
+
+        connection = None
+        while connection is None:
             try:
-                cls.__connection = mysql.connector.connect(
-                    host=DatabaseConfig.HOST,
-                    port=DatabaseConfig.PORT,
-                    user=DatabaseConfig.USER,
-                    password=DatabaseConfig.PASSWORD,
-                    database=DatabaseConfig.DATABASE
-                )
-                print("Database connection established")
-            except Error as e:
-                print(f"Error connecting to database: {e}")
-                raise ConnectionError("Could not connect to database")
-        return cls.__connection
+                connection, opened_at = cls.__pool.get_nowait()
+            except queue.Empty:
+                connection, opened_at = cls.get_connection(), time.monotonic()
+                break
+            if time.monotonic() - opened_at > POOL_RECYCLE:
+                connection.close()
+                connection = None
+
+        local.connection = connection
+        local.opened_at = opened_at
+        local.depth = 1
+        local.failed = False
+        local.on_end = []
+        return connection
+
+    @classmethod
+    def _checkin(cls, discard=False):
+        """Return the current thread's connection to the pool.
+
+        A connection that failed is closed instead of pooled, so the next
+        checkout on any thread starts from a working one.
+        """
+        local = cls.__local
+        local.depth -= 1
+        if local.depth:
+            return
+
+        connection = local.connection
+        local.connection = None
+        if not discard:
+            try:
+                cls.__pool.put_nowait((connection, local.opened_at))
+                return
+            except queue.Full:
+                pass
+        try:
+            connection.close()
+        except _driver().Error:
+            pass
+
+    @classmethod
+    def _reconnect(cls):
+        """Replace the current thread's connection with a new one"""
+        local = cls.__local
+        try:
+            local.connection.close()
+        except _driver().Error:
+            pass
+        local.connection = cls.get_connection()
+        local.opened_at = time.monotonic()
+        return local.connection
+
+    @classmethod
+    def on_transaction_end(cls, callback):
+        """Run `callback` when the current thread's outermost cursor block ends.
+
+        It runs after the commit (or rollback), or straight away when no block
+        is open. Used to drop cache entries once other threads can see a write.
+        """
+        local = cls.__local
+        if getattr(local, 'depth', 0):
+            local.on_end.append(callback)
+        else:
+            callback()
 
     @classmethod
     def close_connection(cls):
-        """Close the database connection"""
-        if cls.__connection and cls.__connection.is_connected():
-            cls.__connection.close()
-            print("Database connection closed")
+        """Close every idle pooled connection"""
+        closed = False
+        while True:
+            try:
+                connection, _ = cls.__pool.get_nowait()
+            except queue.Empty:
+                break
+            if connection.is_connected():
+                connection.close()
+                closed = True
+        if closed:
+            logger.debug("Database connection closed")
 
     
     @classmethod
     @contextmanager
     def get_cursor(cls,dictionary=True):
-        """Context manager for database cursor"""
-        connection = cls.get_connection()
-        cursor = connection.cursor(dictionary=dictionary)
+        """Context manager for database cursor.
+
+        Only the outermost block on a thread commits or rolls back, so nested
+        helpers join the caller's transaction. Any exception rolls the whole
+        transaction back; once an inner block has raised, the outermost block
+        rolls back and raises RuntimeError even if the caller caught the
+        original error, so a partly written transaction never reports success.
+        """
+        connection = cls._checkout()
+        local = cls.__local
+        outermost = local.depth == 1
+        cursor = None
+        broken = False
         try:
+            try:
+                # cursor() checks the connection is still alive
+                cursor = connection.cursor(dictionary=dictionary)
+            except _driver().Error:
+                if not outermost:
+                    raise
+                # A pooled connection dropped while idle; start a fresh one
+                connection = cls._reconnect()
+                cursor = connection.cursor(dictionary=dictionary)
             yield cursor
-            connection.commit()
-        except Error as e:
-            connection.rollback()
-            print(f"Database error: {e}")
+            if outermost and local.failed:
+                # The except below rolls everything back; committing would
+                # keep only part of what the transaction meant to write
+                raise RuntimeError("Transaction rolled back: a nested database block failed")
+            if outermost and connection.in_transaction:
+                connection.commit()
+        except BaseException as e:
+            local.failed = True
+            broken = cursor is None
+            if outermost and not broken:
+                try:
+                    connection.rollback()
+                except _driver().Error:
+                    broken = True
+            if isinstance(e, _driver().Error):
+                logger.debug("Database error: %s", e)
             raise
         finally:
-            cursor.close()
\ No newline at end of file
+            if cursor is not None:
+                try:
+                    cursor.close()
+                except _driver().Error:
+                    # e.g. an unread result; the connection can't be reused
+                    broken = True
+            # Always balance _checkout, or the thread stays "nested" on a
+            # dead connection and never reconnects
+            cls._checkin(discard=broken)
+            if outermost:
+                callbacks, cls.__local.on_end = cls.__local.on_end, []
+                for callback in callbacks:
+                    callback()
@@ -1,41 +1,47 @@
-import mysql.connector
-from mysql.connector import Error
-from config import DatabaseConfig
+from config import get_db_config
 import os
 
+_cfg = get_db_config()
+HOST = _cfg.HOST
+PORT = _cfg.PORT
+USER = _cfg.USER
+PASSWORD = _cfg.PASSWORD
+DATABASE = _cfg.DATABASE
+
 def execute_schema():
     """Execute the schema.sql file to create database tables"""
+    import mysql.connector
+    from mysql.connector import Error
+    from mysql.connector.constants import ClientFlag
 
     # First, connect without specifying database to create it
     connection = None
     try:
         connection = mysql.connector.connect(
-            host=DatabaseConfig.HOST,
-            port=DatabaseConfig.PORT,
-            user=DatabaseConfig.USER,
-            password=DatabaseConfig.PASSWORD
+            host=HOST,
+            port=PORT,
+            user=USER,
+            password=PASSWORD,
+            client_flags=[ClientFlag.MULTI_STATEMENTS]
         )
         cursor = connection.cursor()
 
         # Create database if it doesn't exist
-        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {DatabaseConfig.DATABASE}")
-        print(f"Database '{DatabaseConfig.DATABASE}' created")
+        cursor.execute(f"CREATE DATABASE IF NOT EXISTS {DATABASE}")
+        print(f"Database '{DATABASE}' created")
 
         # Switch to the database
-        cursor.execute(f"USE {DatabaseConfig.DATABASE}")
+        cursor.execute(f"USE {DATABASE}")
 
         # Read and execute schema.sql
         schema_path = os.path.join(os.path.dirname(__file__), 'schema.sql')
         with open(schema_path, 'r') as schema_file:
             schema_sql = schema_file.read()
 
-        # Split by semicolon and execute each statement
-        statements = schema_sql.split(';')
-
-        for statement in statements:
-            statement = statement.strip()
-            if statement:  # Skip empty statements
-                cursor.execute(statement)
+        # Send the whole script in one round trip and drain every result
+        cursor.execute(schema_sql)
+        while cursor.nextset():
+            pass
 
         connection.commit()
         print("Schema executed successfully!")
@@ -17,7 +17,7 @@ CREATE TABLE IF NOT EXISTS freelancer_skills (
     user_id INT,
     skill_name TEXT,
     skill_level TEXT,
-    FOREIGN KEY (user_id) REFERENCES users (user_id)
+    FOREIGN KEY (user_id) REFERENCES users (user_id) ON DELETE CASCADE
 );
 
 -- Table: jobs
@@ -32,6 +32,9 @@ CREATE TABLE IF NOT EXISTS jobs (
     deadline DATE,
     status VARCHAR(20) DEFAULT 'open',
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_jobs_client (client_id, created_at),
+    INDEX idx_jobs_status (status, created_at),
+    FULLTEXT KEY ft_jobs_search (title, description, required_skills),
     FOREIGN KEY (client_id) REFERENCES users (user_id)
 );
 
@@ -43,8 +46,11 @@ CREATE TABLE IF NOT EXISTS applications (
     cover_letter TEXT,
     status VARCHAR(20) DEFAULT 'pending',
     applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (job_id) REFERENCES jobs (job_id),
-    FOREIGN KEY (freelancer_id) REFERENCES users (user_id)
+    UNIQUE KEY uq_applications_job_freelancer (job_id, freelancer_id),
+    INDEX idx_applications_freelancer (freelancer_id, applied_at),
+    INDEX idx_applications_job (job_id, applied_at),
+    FOREIGN KEY (job_id) REFERENCES jobs (job_id) ON DELETE CASCADE,
+    FOREIGN KEY (freelancer_id) REFERENCES users (user_id) ON DELETE CASCADE
 );
 
 -- Table: projects
@@ -55,8 +61,12 @@ CREATE TABLE IF NOT EXISTS projects (
     client_id INT,
     status VARCHAR(20) DEFAULT 'active',
     progress_percentage INT DEFAULT 0,
+    milestones_total INT DEFAULT 0,
+    milestones_approved INT DEFAULT 0,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     completed_at TIMESTAMP,
+    INDEX idx_projects_freelancer (freelancer_id, status, created_at),
+    INDEX idx_projects_client (client_id, created_at),
     FOREIGN KEY (job_id) REFERENCES jobs (job_id),
     FOREIGN KEY (freelancer_id) REFERENCES users (user_id),
     FOREIGN KEY (client_id) REFERENCES users (user_id)
@@ -71,7 +81,10 @@ CREATE TABLE IF NOT EXISTS milestones (
     due_date DATE,
     status VARCHAR(20) DEFAULT 'pending',
     order_number INT,
-    FOREIGN KEY (project_id) REFERENCES projects (project_id)
+    claimed_by VARCHAR(64) DEFAULT NULL,
+    INDEX idx_milestones_project (project_id, order_number),
+    INDEX idx_milestones_review_queue (status, claimed_by),
+    FOREIGN KEY (project_id) REFERENCES projects (project_id) ON DELETE CASCADE
 );
 
 -- Table: submissions
@@ -79,11 +92,13 @@ CREATE TABLE IF NOT EXISTS submissions (
     submission_id INT AUTO_INCREMENT PRIMARY KEY,
     milestone_id INT,
     deliverable_description TEXT,
-    file_path TEXT,
+    file_path VARCHAR(512),
     version_number INT DEFAULT 1,
     submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     client_feedback TEXT,
-    FOREIGN KEY (milestone_id) REFERENCES milestones (milestone_id)
+    UNIQUE KEY uq_submissions_version (milestone_id, version_number),
+    INDEX idx_submissions_history (milestone_id, version_number, submitted_at, file_path),
+    FOREIGN KEY (milestone_id) REFERENCES milestones (milestone_id) ON DELETE CASCADE
 );
 
 -- Table: reviews
@@ -116,8 +131,151 @@ CREATE TABLE IF NOT EXISTS activity_log (
     project_id INT,
     user_id INT,
     activity_type VARCHAR(50),
+    meta JSON,
     description TEXT,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    FOREIGN KEY (project_id) REFERENCES projects (project_id),
+    INDEX idx_activity_project (project_id, activity_id),
+    FOREIGN KEY (project_id) REFERENCES projects (project_id) ON DELETE CASCADE,
     FOREIGN KEY (user_id) REFERENCES users (user_id)
-);
\ No newline at end of file
+);
+
+-- Migrations: bring databases created by an older schema.sql up to date.
+-- MySQL has no ADD COLUMN/INDEX IF NOT EXISTS, so the helpers check
+-- information_schema before altering the table.
+DROP PROCEDURE IF EXISTS sp_add_column_if_missing;
+CREATE PROCEDURE sp_add_column_if_missing(IN p_table VARCHAR(64), IN p_column VARCHAR(64), IN p_definition TEXT)
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.COLUMNS
+                   WHERE TABLE_SCHEMA = DATABASE()
+                     AND TABLE_NAME = p_table
+                     AND COLUMN_NAME = p_column) THEN
+        SET @ddl = CONCAT('ALTER TABLE ', p_table, ' ADD COLUMN ', p_column, ' ', p_definition);
+        PREPARE stmt FROM @ddl;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END;
+
+DROP PROCEDURE IF EXISTS sp_add_index_if_missing;
+CREATE PROCEDURE sp_add_index_if_missing(IN p_table VARCHAR(64), IN p_index VARCHAR(64), IN p_definition TEXT)
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM information_schema.STATISTICS
+                   WHERE TABLE_SCHEMA = DATABASE()
+                     AND TABLE_NAME = p_table
+                     AND INDEX_NAME = p_index) THEN
+        SET @ddl = CONCAT('ALTER TABLE ', p_table, ' ADD ', p_definition);
+        PREPARE stmt FROM @ddl;
+        EXECUTE stmt;
+        DEALLOCATE PREPARE stmt;
+    END IF;
+END;
+
+CALL sp_add_column_if_missing('projects', 'milestones_total', 'INT DEFAULT 0 AFTER progress_percentage');
+CALL sp_add_column_if_missing('projects', 'milestones_approved', 'INT DEFAULT 0 AFTER milestones_total');
+CALL sp_add_column_if_missing('milestones', 'claimed_by', 'VARCHAR(64) DEFAULT NULL AFTER order_number');
+CALL sp_add_index_if_missing('milestones', 'idx_milestones_review_queue',
+                             'INDEX idx_milestones_review_queue (status, claimed_by)');
+CALL sp_add_column_if_missing('activity_log', 'meta', 'JSON AFTER activity_type');
+
+-- One application per freelancer per job. Before adding the key, drop extra
+-- duplicates: per (job, freelancer) keep the accepted row if there is one,
+-- otherwise the earliest
+DELETE a FROM applications a
+JOIN applications b
+  ON b.job_id = a.job_id
+ AND b.freelancer_id = a.freelancer_id
+ AND b.application_id <> a.application_id
+WHERE (b.status = 'accepted') > (a.status = 'accepted')
+   OR ((b.status = 'accepted') = (a.status = 'accepted') AND b.application_id < a.application_id);
+CALL sp_add_index_if_missing('applications', 'uq_applications_job_freelancer',
+                             'UNIQUE KEY uq_applications_job_freelancer (job_id, freelancer_id)');
+
+DROP PROCEDURE sp_add_column_if_missing;
+DROP PROCEDURE sp_add_index_if_missing;
+
+-- Recount the milestone counters before the triggers take over keeping
+-- them current; projects from before the counters existed start at 0
+UPDATE projects p
+SET milestones_total = (SELECT COUNT(*) FROM milestones m
+                        WHERE m.project_id = p.project_id),
+    milestones_approved = (SELECT COUNT(*) FROM milestones m
+                           WHERE m.project_id = p.project_id AND m.status = 'approved');
+
+-- Triggers: keep the milestone counters, progress and completion on projects
+-- in step with milestones. MySQL applies single-table SET assignments left to
+-- right, so the progress columns see the counters already adjusted.
+DROP TRIGGER IF EXISTS trg_milestones_insert;
+CREATE TRIGGER trg_milestones_insert AFTER INSERT ON milestones FOR EACH ROW
+    UPDATE projects
+    SET milestones_total = milestones_total + 1,
+        milestones_approved = milestones_approved + (NEW.status = 'approved'),
+        progress_percentage = IF(milestones_total > 0,
+                                 FLOOR(milestones_approved * 100 / milestones_total), 0),
+        status = IF(milestones_total > 0 AND milestones_approved = milestones_total,
+                    'completed', status),
+        completed_at = IF(milestones_total > 0 AND milestones_approved = milestones_total
+                          AND completed_at IS NULL, NOW(), completed_at)
+    WHERE project_id = NEW.project_id;
+
+DROP TRIGGER IF EXISTS trg_milestones_update;
+CREATE TRIGGER trg_milestones_update AFTER UPDATE ON milestones FOR EACH ROW
+    UPDATE projects
+    SET milestones_approved = milestones_approved + (NEW.status = 'approved') - (OLD.status = 'approved'),
+        progress_percentage = IF(milestones_total > 0,
+                                 FLOOR(milestones_approved * 100 / milestones_total), 0),
+        status = IF(milestones_total > 0 AND milestones_approved = milestones_total,
+                    'completed', status),
+        completed_at = IF(milestones_total > 0 AND milestones_approved = milestones_total
+                          AND completed_at IS NULL, NOW(), completed_at)
+    WHERE project_id = NEW.project_id
+      AND (NEW.status = 'approved') <> (OLD.status = 'approved');
+
+DROP TRIGGER IF EXISTS trg_milestones_delete;
+CREATE TRIGGER trg_milestones_delete AFTER DELETE ON milestones FOR EACH ROW
+    UPDATE projects
+    SET milestones_total = milestones_total - 1,
+        milestones_approved = milestones_approved - (OLD.status = 'approved'),
+        progress_percentage = IF(milestones_total > 0,
+                                 FLOOR(milestones_approved * 100 / milestones_total), 0),
+        status = IF(milestones_total > 0 AND milestones_approved = milestones_total,
+                    'completed', status),
+        completed_at = IF(milestones_total > 0 AND milestones_approved = milestones_total
+                          AND completed_at IS NULL, NOW(), completed_at)
+    WHERE project_id = OLD.project_id;
+
+-- Procedures
+-- Approve a milestone and log it in one call; trg_milestones_update moves
+-- the project's progress and completion along with the status change.
+-- Nothing changes unless p_client_id owns the milestone's project.
+DROP PROCEDURE IF EXISTS sp_approve_milestone;
+CREATE PROCEDURE sp_approve_milestone(IN p_milestone_id INT, IN p_client_id INT, IN p_feedback TEXT)
+BEGIN
+    DECLARE v_project_id INT DEFAULT NULL;
+    DECLARE v_freelancer_id INT DEFAULT NULL;
+
+    SELECT m.project_id, p.freelancer_id INTO v_project_id, v_freelancer_id
+    FROM milestones m
+    JOIN projects p ON m.project_id = p.project_id
+    WHERE m.milestone_id = p_milestone_id
+      AND p.client_id = p_client_id;
+
+    IF v_project_id IS NOT NULL THEN
+        UPDATE milestones SET status = 'approved', claimed_by = NULL WHERE milestone_id = p_milestone_id;
+
+        IF p_feedback IS NOT NULL AND p_feedback <> '' THEN
+            UPDATE submissions
+            SET client_feedback = p_feedback
+            WHERE milestone_id = p_milestone_id
+            ORDER BY version_number DESC
+            LIMIT 1;
+        END IF;
+
+        INSERT INTO activity_log (project_id, user_id, activity_type, meta)
+        VALUES (v_project_id, p_client_id, 'milestone_approved',
+                JSON_OBJECT('milestone_id', p_milestone_id));
+    END IF;
+
+    SELECT v_project_id AS project_id,
+           v_freelancer_id AS freelancer_id,
+           (SELECT status FROM projects WHERE project_id = v_project_id) AS project_status;
+END;
\ No newline at end of file
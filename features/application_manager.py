@@ -1,8 +1,7 @@
-"""Tiny in-memory application manager used during the prototype phase.
+"""Application manager for the CLI prototype.
 
-Nothing here talks to the database yet – everything is stored in a Python list
-so new contributors can follow along without extra setup.  Swapping to the real
-models later will simply require replacing the storage methods.
+Applications are stored in MySQL through `DatabaseManager`; the helpers below
+turn rows into small `ApplicationRecord` objects the CLI can print as tables.
 """
 
 from dataclasses import dataclass, field
@@ -21,14 +20,76 @@ from utils.display import (
     print_warning,
 )
 from features.workspace import WorkspaceManager
-from models.job import Job
 from database.db_manager import DatabaseManager
+from models.application import Application
+from models.job import Job
 
 
 STATUSES = ("pending", "accepted", "rejected")
+_STATUS_LABELS = {status: status.title() for status in STATUSES}
+_now = datetime.now
+
+# SQL is kept in module constants so every call sends the exact same statement text.
+_P = DatabaseManager.PARAM
+
+_SQL_SELECT_APP = """
+    SELECT a.*, u.name as freelancer_name
+    FROM applications a
+    JOIN users u ON a.freelancer_id = u.user_id
+"""
+# A repeat application collides with uq_applications_job_freelancer
+_SQL_INSERT_APP = f"""
+    INSERT INTO applications (job_id, freelancer_id, cover_letter, status)
+    VALUES ({_P}, {_P}, {_P}, 'pending')
+"""
+_SQL_LIST_BY_FREELANCER = _SQL_SELECT_APP + f"""
+    WHERE a.freelancer_id = {_P}
+    ORDER BY a.applied_at DESC
+"""
+_SQL_LIST_BY_JOB = _SQL_SELECT_APP + f"""
+    WHERE a.job_id = {_P}
+    ORDER BY a.applied_at DESC
+"""
+_SQL_LIST_BY_CLIENT = _SQL_SELECT_APP + f"""
+    JOIN jobs j ON a.job_id = j.job_id
+    WHERE j.client_id = {_P}
+    ORDER BY a.applied_at DESC
+"""
+_SQL_GET_APP = _SQL_SELECT_APP + f"""
+    WHERE a.application_id = {_P}
+"""
+_SQL_GET_APPS_IN = _SQL_SELECT_APP + """
+    WHERE a.application_id IN ({placeholders})
+    ORDER BY a.application_id
+"""
+# Locks both the application and its job, so two acceptances for one job
+# (or for one application) run one after the other
+_SQL_GET_ACCEPT_TARGET = f"""
+    SELECT a.job_id, a.freelancer_id, a.status, j.client_id, j.status as job_status,
+           j.title as job_title
+    FROM applications a
+    JOIN jobs j ON a.job_id = j.job_id
+    WHERE a.application_id = {_P}
+    FOR UPDATE
+"""
+_SQL_ACCEPT_PENDING = f"""
+    UPDATE applications
+    SET status = 'accepted'
+    WHERE application_id = {_P} AND status = 'pending'
+"""
+_SQL_CLOSE_JOB = f"""
+    UPDATE jobs
+    SET status = 'closed'
+    WHERE job_id = {_P}
+"""
+_SQL_SET_STATUS = f"""
+    UPDATE applications
+    SET status = {_P}
+    WHERE application_id = {_P}
+"""
 
 
-@dataclass
+@dataclass(slots=True)
 class ApplicationRecord:
     """Simple container that keeps each application tidy."""
 
@@ -38,7 +99,7 @@ class ApplicationRecord:
     freelancer_name: str
     cover_letter: str
     status: str = "pending"
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=_now)
 
     def as_row(self) -> tuple[str, str, str, str]:
         """Return a tuple ready for print_table."""
@@ -46,7 +107,7 @@ class ApplicationRecord:
             str(self.application_id),
             str(self.job_id),
             f"{self.freelancer_name} (#{self.freelancer_id})",
-            f"{self.status.title()}",
+            _STATUS_LABELS.get(self.status) or self.status.title(),
         )
 
 
@@ -60,75 +121,51 @@ class ApplicationManager:
     # CRUD-like helpers
     # ------------------------------------------------------------------
     def submit(self, job_id: int, freelancer_id: int, freelancer_name: str, cover_letter: str) -> ApplicationRecord:
-        """Submit a new application to the database"""
-        with DatabaseManager.get_cursor() as cursor:
-            query = """
-                INSERT INTO applications (job_id, freelancer_id, cover_letter, status)
-                VALUES (%s, %s, %s, 'pending')
-            """
-            cursor.execute(query, (job_id, freelancer_id, cover_letter.strip()))
-            application_id = cursor.lastrowid
-
-            # Fetch the created application
-            cursor.execute("""
-                SELECT a.*, u.name as freelancer_name
-                FROM applications a
-                JOIN users u ON a.freelancer_id = u.user_id
-                WHERE a.application_id = %s
-            """, (application_id,))
-            row = cursor.fetchone()
-
-            return self._row_to_record(row)
+        """Submit a new application to the database
+
+        Raises ValueError if the freelancer already applied to this job.
+        """
+        cover_letter = cover_letter.strip()
+        try:
+            with DatabaseManager.get_cursor() as cursor:
+                cursor.execute(_SQL_INSERT_APP, (job_id, freelancer_id, cover_letter))
+                application_id = cursor.lastrowid
+        except Exception as e:
+            if DatabaseManager.is_duplicate_key(e):
+                raise ValueError("You have already applied to this job.") from e
+            raise
+
+        # Everything but the ID is already known, so skip the re-SELECT
+        return ApplicationRecord(
+            application_id=application_id,
+            job_id=job_id,
+            freelancer_id=freelancer_id,
+            freelancer_name=freelancer_name,
+            cover_letter=cover_letter,
+        )
 
     def list_for_freelancer(self, freelancer_id: int) -> List[ApplicationRecord]:
         """Get all applications for a freelancer"""
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT a.*, u.name as freelancer_name
-                FROM applications a
-                JOIN users u ON a.freelancer_id = u.user_id
-                WHERE a.freelancer_id = %s
-                ORDER BY a.applied_at DESC
-            """, (freelancer_id,))
-            rows = cursor.fetchall()
-            return [self._row_to_record(row) for row in rows]
+            cursor.execute(_SQL_LIST_BY_FREELANCER, (freelancer_id,))
+            return [self._row_to_record(row) for row in cursor]
 
     def list_for_job(self, job_id: int) -> List[ApplicationRecord]:
         """Get all applications for a job"""
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT a.*, u.name as freelancer_name
-                FROM applications a
-                JOIN users u ON a.freelancer_id = u.user_id
-                WHERE a.job_id = %s
-                ORDER BY a.applied_at DESC
-            """, (job_id,))
-            rows = cursor.fetchall()
-            return [self._row_to_record(row) for row in rows]
+            cursor.execute(_SQL_LIST_BY_JOB, (job_id,))
+            return [self._row_to_record(row) for row in cursor]
 
     def list_for_client(self, client_id: int) -> List[ApplicationRecord]:
         """Get all applications for all jobs posted by a client"""
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT a.*, u.name as freelancer_name
-                FROM applications a
-                JOIN users u ON a.freelancer_id = u.user_id
-                JOIN jobs j ON a.job_id = j.job_id
-                WHERE j.client_id = %s
-                ORDER BY a.applied_at DESC
-            """, (client_id,))
-            rows = cursor.fetchall()
-            return [self._row_to_record(row) for row in rows]
+            cursor.execute(_SQL_LIST_BY_CLIENT, (client_id,))
+            return [self._row_to_record(row) for row in cursor]
 
     def get_application(self, application_id: int) -> Optional[ApplicationRecord]:
         """Get an application by ID"""
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT a.*, u.name as freelancer_name
-                FROM applications a
-                JOIN users u ON a.freelancer_id = u.user_id
-                WHERE a.application_id = %s
-            """, (application_id,))
+            cursor.execute(_SQL_GET_APP, (application_id,))
             row = cursor.fetchone()
             return self._row_to_record(row) if row else None
 
@@ -139,27 +176,77 @@ class ApplicationManager:
             raise ValueError(f"Status must be one of: {', '.join(STATUSES)}")
 
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                UPDATE applications
-                SET status = %s
-                WHERE application_id = %s
-            """, (new_status, application_id))
+            cursor.execute(_SQL_SET_STATUS, (new_status, application_id))
+            Application.invalidate(application_id)
 
             if cursor.rowcount == 0:
                 return None
 
             return self.get_application(application_id)
 
+    def set_status_many(self, application_ids: List[int], new_status: str) -> List[ApplicationRecord]:
+        """Update the status of several applications in one transaction"""
+        new_status = new_status.lower()
+        if new_status not in STATUSES:
+            raise ValueError(f"Status must be one of: {', '.join(STATUSES)}")
+        if not application_ids:
+            return []
+
+        with DatabaseManager.get_cursor() as cursor:
+            cursor.executemany(
+                _SQL_SET_STATUS,
+                [(new_status, application_id) for application_id in application_ids]
+            )
+            for application_id in application_ids:
+                Application.invalidate(application_id)
+
+            placeholders = ", ".join([_P] * len(application_ids))
+            cursor.execute(
+                _SQL_GET_APPS_IN.format(placeholders=placeholders),
+                tuple(application_ids)
+            )
+            return [self._row_to_record(row) for row in cursor]
+
+    def accept_and_open_workspace(self, application_id: int) -> Optional[dict]:
+        """Accept an application, close its job and create the workspace in one transaction
+
+        Returns None when the application is no longer pending or its job is
+        no longer open, so a job never gets a second workspace.
+        """
+        with DatabaseManager.get_cursor() as cursor:
+            cursor.execute(_SQL_GET_ACCEPT_TARGET, (application_id,))
+            target = cursor.fetchone()
+            if (not target or not target['client_id']
+                    or target['status'] != 'pending' or target['job_status'] != 'open'):
+                return None
+
+            cursor.execute(_SQL_ACCEPT_PENDING, (application_id,))
+            if cursor.rowcount == 0:
+                return None
+            cursor.execute(_SQL_CLOSE_JOB, (target['job_id'],))
+            Application.invalidate(application_id)
+            Job.invalidate(target['job_id'])
+
+            # create_workspace shares this connection, so it commits with the rest
+            project_id = WorkspaceManager.create_workspace(
+                application_id=application_id,
+                job_id=target['job_id'],
+                freelancer_id=target['freelancer_id'],
+                client_id=target['client_id']
+            )
+            return {'project_id': project_id, 'job_title': target['job_title']}
+
     def _row_to_record(self, row) -> ApplicationRecord:
         """Convert database row to ApplicationRecord"""
+        # Positional arguments follow the ApplicationRecord field order
         return ApplicationRecord(
-            application_id=row['application_id'],
-            job_id=row['job_id'],
-            freelancer_id=row['freelancer_id'],
-            freelancer_name=row['freelancer_name'],
-            cover_letter=row['cover_letter'],
-            status=row['status'],
-            created_at=row['applied_at'] if 'applied_at' in row else datetime.now()
+            row['application_id'],
+            row['job_id'],
+            row['freelancer_id'],
+            row['freelancer_name'],
+            row['cover_letter'],
+            row['status'],
+            row.get('applied_at') or _now()
         )
 
 
@@ -178,21 +265,30 @@ def _show_table(records: List[ApplicationRecord], empty_message: str) -> None:
     print_table(("ID", "Job ID", "Freelancer", "Status"), rows)
 
 
-def _apply_flow(user) -> None:
+def _apply_flow(user) -> bool:
+    """Walk the freelancer through applying; returns True if an application was saved."""
     search_open_jobs()
     job_id = ask_int("Job ID you want to apply to:")
     if job_id is None:
         print_error("Job ID is required.")
-        return
+        return False
     cover_letter = ask_input("Add a short cover letter:")
     if len(cover_letter.strip()) < 5:
         print_error("Try to write at least a few words so the client has context.")
-        return
-    application = application_manager.submit(job_id, user.user_id, user.name, cover_letter)
+        return False
+    try:
+        application_manager.submit(job_id, user.user_id, user.name, cover_letter)
+    except ValueError as e:
+        print_error(str(e))
+        return False
     print_success(f"Application submitted!")
+    return True
 
 
 def _freelancer_menu(user) -> None:
+    # Applications are loaded once per visit and reloaded only after this
+    # menu writes, so browsing the list again costs no query
+    records = None
     while True:
         print_heading("Freelancer Applications")
         print(" 1. Apply to a job")
@@ -202,21 +298,44 @@ def _freelancer_menu(user) -> None:
         if choice == "0":
             break
         if choice == "1":
-            _apply_flow(user)
+            if _apply_flow(user):
+                records = None
         elif choice == "2":
-            records = application_manager.list_for_freelancer(user.user_id)
+            if records is None:
+                records = application_manager.list_for_freelancer(user.user_id)
             _show_table(records, "You have not applied to any jobs yet.")
         else:
             print_info("Unknown option, please try again.")
 
 
+def _accept_application(application_id: int) -> None:
+    """Accept an application, open its workspace and close the job."""
+    try:
+        result = application_manager.accept_and_open_workspace(application_id)
+    except Exception as e:
+        print_error(f"Error accepting application #{application_id}: {e}")
+        return
+
+    if not result:
+        print_warning(f"Could not accept application #{application_id}: it is no longer pending "
+                      "or its job is already filled.")
+        return
+
+    print_success(f"Application #{application_id} marked as accepted.")
+    print_success(f"Workspace created! Project ID: {result['project_id']}")
+    print_info("The freelancer can now access the workspace from the Workspace Manager menu.")
+    print_success(f"Job '{result['job_title']}' has been closed and removed from open job listings.")
+
+
 def _client_menu(user) -> None:
-    
+    # The client's applications are loaded once per visit and reloaded only
+    # after an accept or reject changes them
+    client_records = None
     while True:
         print_heading("Client Applications")
         print(" 1. View applications for a job")
-        print(" 2. Accept an application")
-        print(" 3. Reject an application")
+        print(" 2. Accept application(s)")
+        print(" 3. Reject application(s)")
         print(" 0. Back to main menu")
         choice = ask_input("Choose an option:")
         if choice == "0":
@@ -230,14 +349,13 @@ def _client_menu(user) -> None:
             records = application_manager.list_for_job(job_id)
             _show_table(records, "No one has applied to this job yet.")
         elif choice in {"2", "3"}:
-            # First, show all applications for the client's jobs
-            records = application_manager.list_for_client(user.user_id)
-            if not records:
+            if client_records is None:
+                client_records = application_manager.list_for_client(user.user_id)
+            pending_records = [record for record in client_records if record.status == "pending"]
+            if not client_records:
                 print_info("No applications found for your jobs.")
                 continue
 
-            # Filter to show only pending applications for accept/reject
-            pending_records = [r for r in records if r.status == "pending"]
             if not pending_records:
                 print_info("No pending applications to update.")
                 continue
@@ -245,45 +363,34 @@ def _client_menu(user) -> None:
             print_info(f"\nPending applications for your jobs:")
             _show_table(pending_records, "No pending applications.")
 
-            application_id = ask_int("\nApplication ID to update:")
-            if application_id is None:
-                print_error("Application ID is required.")
+            raw_ids = ask_input("\nApplication ID(s) to update (comma separated):")
+            try:
+                application_ids = [int(part) for part in raw_ids.split(",") if part.strip()]
+            except ValueError:
+                print_error("Application IDs must be numbers, e.g. 4 or 4, 7, 9.")
                 continue
             new_status = "accepted" if choice == "2" else "rejected"
 
-            # Get the application details before updating
-            application = application_manager.get_application(application_id)
-
-            updated = application_manager.set_status(application_id, new_status)
-            if not updated:
-                print_error("Could not find that application ID.")
+            # Only pending applications on this client's jobs can be updated
+            pending_ids = {record.application_id for record in pending_records}
+            valid_ids = []
+            for application_id in dict.fromkeys(application_ids):
+                if application_id in pending_ids:
+                    valid_ids.append(application_id)
+                else:
+                    print_error(f"Could not find pending application #{application_id}.")
+
+            if valid_ids:
+                client_records = None
+
+            if new_status == "accepted":
+                # Each acceptance also creates a workspace and closes the job
+                for application_id in valid_ids:
+                    _accept_application(application_id)
             else:
-                print_success(f"Application #{application_id} marked as {new_status}.")
-
-                # Auto-create workspace and close job when application is accepted
-                if new_status == "accepted" and application:
-                    try:
-                        # Get job details to find client_id
-                        job = Job.find_by_id(application.job_id)
-                        if job and job.client_id:
-                            # Create workspace
-                            project_id = WorkspaceManager.create_workspace(
-                                application_id=application.application_id,
-                                job_id=application.job_id,
-                                freelancer_id=application.freelancer_id,
-                                client_id=job.client_id
-                            )
-                            print_success(f"Workspace created! Project ID: {project_id}")
-                            print_info("The freelancer can now access the workspace from the Workspace Manager menu.")
-
-                            # Close the job so it doesn't appear in searches anymore
-                            job.close()
-                            print_success(f"Job '{job.title}' has been closed and removed from open job listings.")
-                        else:
-                            print_warning("Could not create workspace: Job or client information not found.")
-                    except Exception as e:
-                        print_error(f"Error creating workspace: {e}")
-                        print_info("Application was accepted, but workspace creation failed.")
+                updated_records = application_manager.set_status_many(valid_ids, new_status)
+                for application in updated_records:
+                    print_success(f"Application #{application.application_id} marked as {new_status}.")
         else:
             print_info("Unknown option, please try again.")
 
@@ -5,10 +5,12 @@ Allows clients to browse all freelancers or find freelancers matching
 specific job requirements based on skills.
 """
 
-from typing import List, Optional
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple
 
 from models.job import Job
 from models.user import User, find_freelancers_by_skills, list_users
+from utils.auth import require_role
 from utils.display import (
     ask_input,
     divider,
@@ -19,6 +21,8 @@ from utils.display import (
     print_warning,
 )
 
+_CARD_DIVIDER = "-" * 50
+
 
 def _format_freelancer(freelancer: User, index: Optional[int] = None) -> str:
     """Format a freelancer's information for display."""
@@ -26,23 +30,35 @@ def _format_freelancer(freelancer: User, index: Optional[int] = None) -> str:
     skills = ", ".join(freelancer.skills) if freelancer.skills else "No skills listed"
     location = freelancer.location or "Not specified"
 
-    return (
-        f"{prefix}{freelancer.name} (ID: {freelancer.user_id})\n"
-        f"   Email: {freelancer.email}\n"
-        f"   Location: {location}\n"
-        f"   Skills: {skills}\n"
-        + ("-" * 50)
-    )
+    return "\n".join((
+        f"{prefix}{freelancer.name} (ID: {freelancer.user_id})",
+        f"   Email: {freelancer.email}",
+        f"   Location: {location}",
+        f"   Skills: {skills}",
+        _CARD_DIVIDER,
+    ))
 
 
-def browse_all_freelancers(current_user) -> None:
-    """Display all freelancers on the platform."""
-    if not current_user or current_user.get("user_type") != "client":
-        print_error("Only client accounts can browse freelancers.")
-        return
+@lru_cache(maxsize=4096)
+def _compute_matches(required_set: FrozenSet[str], skills: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Return the freelancer skills, in their own spelling, found in required_set."""
+    return tuple(skill for skill in skills if skill.strip().lower() in required_set)
 
+
+def _all_freelancers(cache: Optional[dict] = None) -> List[User]:
+    """Return every freelancer, reusing the copy cached for this menu session."""
+    if cache is None:
+        return list_users("freelancer")
+    if "freelancers" not in cache:
+        cache["freelancers"] = list_users("freelancer")
+    return cache["freelancers"]
+
+
+@require_role("client", "Only client accounts can browse freelancers.")
+def browse_all_freelancers(current_user, cache: Optional[dict] = None) -> None:
+    """Display all freelancers on the platform."""
     print_heading("Browse All Freelancers")
-    freelancers = list_users("freelancer")
+    freelancers = _all_freelancers(cache)
 
     if not freelancers:
         print_warning("No freelancers registered yet.")
@@ -50,16 +66,15 @@ def browse_all_freelancers(current_user) -> None:
 
     print_info(f"Found {len(freelancers)} freelancer(s).")
     divider()
-    for index, freelancer in enumerate(freelancers, start=1):
-        print(_format_freelancer(freelancer, index))
+    print("\n".join(
+        _format_freelancer(freelancer, index)
+        for index, freelancer in enumerate(freelancers, start=1)
+    ))
 
 
-def find_matching_freelancers_for_job(current_user) -> None:
+@require_role("client", "Only client accounts can search for matching freelancers.")
+def find_matching_freelancers_for_job(current_user, cache: Optional[dict] = None) -> None:
     """Find freelancers matching a specific job's required skills."""
-    if not current_user or current_user.get("user_type") != "client":
-        print_error("Only client accounts can search for matching freelancers.")
-        return
-
     print_heading("Find Freelancers for Your Job")
 
     # Get client's jobs
@@ -111,31 +126,37 @@ def find_matching_freelancers_for_job(current_user) -> None:
         print_info(f"Looking for skills: {', '.join(required_skills)}")
         freelancers = find_freelancers_by_skills(required_skills)
     else:
-        freelancers = list_users("freelancer")
+        freelancers = _all_freelancers(cache)
 
     if not freelancers:
         print_warning("No freelancers found with matching skills.")
         return
 
+    # Lowercased once so each membership check below is a set lookup
+    required_set = frozenset(skill.strip().lower() for skill in required_skills)
+
+    # Rank by how many required skills each freelancer covers; the stable sort
+    # keeps the newest-first order among freelancers with the same overlap.
+    ranked = sorted(
+        ((freelancer, _compute_matches(required_set, tuple(freelancer.skills))) for freelancer in freelancers),
+        key=lambda pair: len(pair[1]),
+        reverse=True,
+    )
+
     print_success(f"Found {len(freelancers)} matching freelancer(s)!")
     divider()
-    for index, freelancer in enumerate(freelancers, start=1):
+    for index, (freelancer, matches) in enumerate(ranked, start=1):
         print(_format_freelancer(freelancer, index))
         # Show which skills match
-        if required_skills:
-            matching_skills = [
-                skill for skill in freelancer.skills
-                if skill in required_skills
-            ]
-            if matching_skills:
-                print(f"   ✓ Matches: {', '.join(matching_skills)}\n")
+        if matches:
+            print(f"   ✓ Matches: {', '.join(matches)}\n")
 
 
+@require_role("client", "Only client accounts can browse freelancers.")
 def freelancer_browser_menu(current_user) -> None:
     """Menu for browsing and finding freelancers."""
-    if not current_user or current_user.get("user_type") != "client":
-        print_error("Only client accounts can browse freelancers.")
-        return
+    # Freelancer list fetched at most once while this menu stays open
+    session_cache: dict = {}
 
     while True:
         print_heading("Freelancer Browser")
@@ -149,10 +170,10 @@ def freelancer_browser_menu(current_user) -> None:
         if choice == "0":
             break
         elif choice == "1":
-            browse_all_freelancers(current_user)
+            browse_all_freelancers(current_user, session_cache)
             input("\nPress Enter to continue...")
         elif choice == "2":
-            find_matching_freelancers_for_job(current_user)
+            find_matching_freelancers_for_job(current_user, session_cache)
             input("\nPress Enter to continue...")
         else:
             print_error("Invalid option. Please try again.")
@@ -10,6 +10,7 @@ from datetime import datetime
 from typing import Dict, Optional, Union
 
 from models.job import Job
+from utils.auth import require_role
 from utils.display import (
     ask_input,
     print_error,
@@ -19,6 +20,9 @@ from utils.display import (
     print_success,
     print_warning,
 )
+from utils.validation import NUMBER_RE
+
+_CARD_DIVIDER = "-" * 50
 
 
 def _prompt_number(label: str) -> Optional[float]:
@@ -29,10 +33,9 @@ def _prompt_number(label: str) -> Optional[float]:
         raw_value = ask_input(f"{label} (press Enter to skip):", allow_empty=True)
         if raw_value == "":
             return None
-        try:
+        if NUMBER_RE.match(raw_value):
             return float(raw_value)
-        except ValueError:
-            print_error("Please enter a number like 500 or 1200.50.")
+        print_error("Please enter a number like 500 or 1200.50.")
 
 
 def _prompt_deadline() -> Optional[str]:
@@ -89,11 +92,12 @@ def _format_job(job: Job, index: Optional[int] = None) -> str:
         line_two,
         f"   {budget}",
         f"   Deadline: {job.deadline or 'Flexible'}",
-        "-" * 50,
+        _CARD_DIVIDER,
     ]
     return "\n".join(details)
 
 
+@require_role("client", "Only client accounts can post jobs.")
 def post_new_job(current_user):
     """
     Collect job information and save it to the database.
@@ -101,10 +105,6 @@ def post_new_job(current_user):
     Returns the Job instance or None when posting is not allowed.
     """
 
-    if not current_user or current_user.get("user_type") != "client":
-        print_error("Only client accounts can post jobs.")
-        return None
-
     print_heading("Post a New Job")
     print_info("We only ask for a few details so freelancers know what you need.")
     job_details = _collect_job_details()
@@ -117,13 +117,10 @@ def post_new_job(current_user):
     return job
 
 
+@require_role("client", "Only client accounts can view posted jobs.", default_factory=list)
 def show_client_jobs(current_user):
     """Display all jobs that belong to the current client."""
 
-    if not current_user or current_user.get("user_type") != "client":
-        print_error("Only client accounts can view posted jobs.")
-        return []
-
     print_heading("My Posted Jobs")
     jobs = Job.get_by_client(current_user["user_id"])
     if not jobs:
@@ -131,20 +128,16 @@ def show_client_jobs(current_user):
         return []
 
     print_info(f"You have {len(jobs)} job(s).")
-    for index, job in enumerate(jobs, start=1):
-        print(_format_job(job, index))
+    print("\n".join(_format_job(job, index) for index, job in enumerate(jobs, start=1)))
     return jobs
 
 
+@require_role("client", "Please sign in with a client account to use job tools.")
 def job_posting_menu(current_user):
     """
     Very small menu loop so the rest of the app can call a single function.
     """
 
-    if not current_user or current_user.get("user_type") != "client":
-        print_error("Please sign in with a client account to use job tools.")
-        return
-
     menu_choices = [
         ("1", "Post a new job"),
         ("2", "View my jobs"),
@@ -5,7 +5,7 @@ The goal is to keep the flow friendly for newcomers, so each function only does
 one thing and includes short comments that explain what is happening.
 """
 
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Union
 
 from models.job import Job
 from utils.display import (
@@ -17,6 +17,18 @@ from utils.display import (
     print_table,
     print_warning,
 )
+from utils.validation import NUMBER_RE
+
+# Budget label per (min missing, max missing) so each row is a single lookup
+_BUDGET_FMT = {
+    (True, True): lambda low, high: "Not provided",
+    (True, False): lambda low, high: "Up to $%.0f" % high,
+    (False, True): lambda low, high: "From $%.0f" % low,
+    (False, False): lambda low, high: "$%.0f - $%.0f" % (low, high),
+}
+
+# Column widths for the results table (ID, Title, Budget, Skills)
+_RESULT_WIDTHS = (6, 30, 18, 30)
 
 
 def _prompt_budget(label: str) -> Optional[float]:
@@ -25,46 +37,35 @@ def _prompt_budget(label: str) -> Optional[float]:
         raw_value = ask_input(f"{label} (press Enter to skip):", allow_empty=True)
         if raw_value == "":
             return None
-        try:
+        if NUMBER_RE.match(raw_value):
             return float(raw_value)
-        except ValueError:
-            print_error("Please enter numbers only, e.g. 1200 or 500.50.")
+        print_error("Please enter numbers only, e.g. 1200 or 500.50.")
 
 
-def _collect_filters() -> Dict[str, Optional[Union[str, float]]]:
+def _collect_filters() -> Dict[str, Optional[Union[List[str], float]]]:
     """Ask the user which filters to apply."""
     keywords = ask_input("Keywords (title, skills, etc.):", allow_empty=True)
     min_budget = _prompt_budget("Minimum budget")
     max_budget = _prompt_budget("Maximum budget")
 
+    # Split once here so the search can match each word on its own.
     return {
-        "keywords": keywords or None,
+        "keywords": keywords.split() or None,
         "min_budget": min_budget,
         "max_budget": max_budget,
     }
 
 
-def _jobs_to_rows(jobs: List[Job]) -> List[List[str]]:
-    """Convert Job objects into table-friendly rows."""
-    rows: List[List[str]] = []
+def _jobs_to_rows(jobs: Iterable[Job]) -> Iterator[List[str]]:
+    """Convert Job objects into table-friendly rows, one at a time."""
     for job in jobs:
-        if job.budget_min is None and job.budget_max is None:
-            budget_text = "Not provided"
-        elif job.budget_min is None:
-            budget_text = f"Up to ${job.budget_max:.0f}"
-        elif job.budget_max is None:
-            budget_text = f"From ${job.budget_min:.0f}"
-        else:
-            budget_text = f"${job.budget_min:.0f} - ${job.budget_max:.0f}"
-        rows.append(
-            [
-                str(job.job_id or "-"),
-                job.title or "Untitled",
-                budget_text,
-                job.required_skills or "Skills not listed",
-            ]
-        )
-    return rows
+        budget_min, budget_max = job.budget_min, job.budget_max
+        yield [
+            str(job.job_id or "-"),
+            job.title or "Untitled",
+            _BUDGET_FMT[(budget_min is None, budget_max is None)](budget_min, budget_max),
+            job.required_skills or "Skills not listed",
+        ]
 
 
 def search_open_jobs() -> List[Job]:
@@ -78,6 +79,7 @@ def search_open_jobs() -> List[Job]:
 
     filters = _collect_filters()
     job_gateway = Job()
+    # One bounded page, fetched before anything is printed
     results = job_gateway.search(
         keywords=filters["keywords"],
         min_budget=filters["min_budget"],
@@ -89,9 +91,11 @@ def search_open_jobs() -> List[Job]:
         return []
 
     print_info(f"Showing {len(results)} open job(s).")
+    # Fixed widths let the table print rows without measuring them first
     print_table(
         headers=("ID", "Title", "Budget", "Skills"),
         rows=_jobs_to_rows(results),
+        column_widths=_RESULT_WIDTHS,
     )
     return results
 
@@ -1,13 +1,30 @@
-from database.db_manager import DatabaseManager
-from models.portfolio import Portfolio
+from functools import lru_cache
+
 from utils.display import Display
 
+# Colored labels are identical on every card, so build them once
+_SKILLS_LABEL = Display.color_text('Skills Used:', 'yellow')
+_COMPLETED_LABEL = Display.color_text('Completed:', 'yellow')
+_RATING_LABEL = Display.color_text('Rating:', 'yellow')
+_CLIENT_REVIEW_LABEL = Display.color_text('Client Review:', 'magenta', bold=True)
+_NO_COMMENT = Display.color_text('No comment provided', 'gray')
+_ELLIPSIS = Display.color_text('...', 'gray')
+
+
+@lru_cache(maxsize=1024)
+def _wrap(text, width):
+    """Wrap text once and reuse the lines on later portfolio views"""
+    return tuple(Display._wrap_text(text, width))
+
+
 class PortfolioManager:
     """Portfolio service to manage project display and completions"""
 
     @staticmethod
     def display_portfolio(freelancer_id):
         """Display complete portfolio for a freelancer"""
+        from models.portfolio import Portfolio
+
         portfolio_data = Portfolio.to_dict(freelancer_id)
 
         if not portfolio_data:
@@ -57,12 +74,16 @@ class PortfolioManager:
 
         Display.print_subheader("Completed Projects")
 
-        for project in projects:
-            PortfolioManager.print_project_card(project)
+        print("\n".join(PortfolioManager.format_project_card(project) for project in projects))
 
     @staticmethod
     def print_project_card(project):
         """Print a formatted project card"""
+        print(PortfolioManager.format_project_card(project))
+
+    @staticmethod
+    def format_project_card(project):
+        """Build a formatted project card as a single string"""
         project_id = project.get('project_id', 'N/A')
         title = project.get('title', 'Untitled Project')
         description = project.get('description', 'No description available')
@@ -71,34 +92,36 @@ class PortfolioManager:
         rating = project.get('rating')
         review_comment = project.get('review_comment')
 
-        print("\n" + "+" + "-" * 78 + "+")
-        print(f"| {Display.color_text(f'Project: {title}', 'cyan', bold=True):<87}|")
-        print("+" + "-" * 78 + "+")
+        lines = ["\n" + "+" + "-" * 78 + "+"]
+        lines.append(f"| {Display.color_text(f'Project: {title}', 'cyan', bold=True):<87}|")
+        lines.append("+" + "-" * 78 + "+")
 
-        desc_lines = Display._wrap_text(description, 74)
+        desc_lines = _wrap(description, 74)
         for line in desc_lines[:3]:
-            print(f"| {line:<76} |")
+            lines.append(f"| {line:<76} |")
         if len(desc_lines) > 3:
-            print(f"| {Display.color_text('...', 'gray'):<85}|")
+            lines.append(f"| {_ELLIPSIS:<85}|")
 
-        print("+" + "-" * 78 + "+")
-        print(f"| {Display.color_text('Skills Used:', 'yellow')} {skills}".ljust(87) + "|")
-        print(f"| {Display.color_text('Completed:', 'yellow')} {completed_at}".ljust(87) + "|")
+        lines.append("+" + "-" * 78 + "+")
+        lines.append(f"| {_SKILLS_LABEL} {skills}".ljust(87) + "|")
+        lines.append(f"| {_COMPLETED_LABEL} {completed_at}".ljust(87) + "|")
 
         if rating:
             stars = "★" * int(rating) + "☆" * (5 - int(rating))
-            print(f"| {Display.color_text('Rating:', 'yellow')} {Display.color_text(stars, 'green')} ({rating}/5)".ljust(96) + "|")
+            lines.append(f"| {_RATING_LABEL} {Display.color_text(stars, 'green')} ({rating}/5)".ljust(96) + "|")
 
         if review_comment:
-            print("+" + "-" * 78 + "+")
-            print(f"| {Display.color_text('Client Review:', 'magenta', bold=True):<87}|")
-            review_lines = Display._wrap_text(review_comment, 74)
+            lines.append("+" + "-" * 78 + "+")
+            lines.append(f"| {_CLIENT_REVIEW_LABEL:<87}|")
+            review_lines = _wrap(review_comment, 74)
             for line in review_lines[:2]:
-                print(f"| {line:<76} |")
+                lines.append(f"| {line:<76} |")
             if len(review_lines) > 2:
-                print(f"| {Display.color_text('...', 'gray'):<85}|")
+                lines.append(f"| {_ELLIPSIS:<85}|")
+
+        lines.append("+" + "-" * 78 + "+\n")
 
-        print("+" + "-" * 78 + "+\n")
+        return "\n".join(lines)
 
     @staticmethod
     def display_reviews(reviews):
@@ -109,12 +132,16 @@ class PortfolioManager:
 
         Display.print_subheader("Client Reviews")
 
-        for review in reviews:
-            PortfolioManager.print_review_card(review)
+        print("\n".join(PortfolioManager.format_review_card(review) for review in reviews))
 
     @staticmethod
     def print_review_card(review):
         """Print a formatted review card"""
+        print(PortfolioManager.format_review_card(review))
+
+    @staticmethod
+    def format_review_card(review):
+        """Build a formatted review card as a single string"""
         reviewer_name = review.get('reviewer_name', 'Anonymous')
         rating = review.get('rating', 0)
         comment = review.get('comment', '')
@@ -122,19 +149,21 @@ class PortfolioManager:
 
         stars = "★" * int(rating) + "☆" * (5 - int(rating))
 
-        print("\n" + "┌" + "─" * 78 + "┐")
-        print(f"│ {Display.color_text(reviewer_name, 'cyan', bold=True):<87}│")
-        print(f"│ {Display.color_text(stars, 'green')} ({rating}/5) - {created_at}".ljust(87) + "│")
-        print("├" + "─" * 78 + "┤")
+        lines = ["\n" + "┌" + "─" * 78 + "┐"]
+        lines.append(f"│ {Display.color_text(reviewer_name, 'cyan', bold=True):<87}│")
+        lines.append(f"│ {Display.color_text(stars, 'green')} ({rating}/5) - {created_at}".ljust(87) + "│")
+        lines.append("├" + "─" * 78 + "┤")
 
         if comment:
-            comment_lines = Display._wrap_text(comment, 74)
+            comment_lines = _wrap(comment, 74)
             for line in comment_lines:
-                print(f"│ {line:<76} │")
+                lines.append(f"│ {line:<76} │")
         else:
-            print(f"│ {Display.color_text('No comment provided', 'gray'):<85}│")
+            lines.append(f"│ {_NO_COMMENT:<85}│")
+
+        lines.append("└" + "─" * 78 + "┘\n")
 
-        print("└" + "─" * 78 + "┘\n")
+        return "\n".join(lines)
 
     @staticmethod
     def show_portfolio_menu():
@@ -153,7 +182,9 @@ class PortfolioManager:
     @staticmethod
     def display_portfolio_summary(freelancer_id):
         """Display a summary view of the portfolio"""
-        stats = Portfolio.get_stats(freelancer_id)
+        from models.portfolio import Portfolio
+
+        stats = Portfolio.to_dict(freelancer_id)['stats']
 
         if not stats:
             Display.print_warning("No portfolio data available")
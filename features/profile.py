@@ -1,27 +1,38 @@
-from models.user import User, get_user_by_email
+from collections import namedtuple
+
 from utils.display import Display
 
+# Read-only view of whatever user shape a caller hands us
+UserView = namedtuple('UserView', 'name email location user_type created_at skills')
+
+
+def _coerce_to_view(user):
+    """Normalize a user dict or User object into a UserView"""
+    if isinstance(user, dict):
+        return UserView(
+            user.get('name', 'Unknown'),
+            user.get('email', 'N/A'),
+            user.get('location', 'N/A'),
+            user.get('user_type', 'N/A'),
+            user.get('created_at', 'N/A'),
+            user.get('skills'),
+        )
+    return UserView(user.name, user.email, user.location, user.user_type,
+                    user.created_at, user.skills)
+
+
 class ProfileManager:
     """Profile service to display and manage user profiles"""
 
     @staticmethod
     def display_profile(user):
         """Display user profile with all information"""
-        if isinstance(user, dict):
-            user_data = user
-        else:
-            user_data = {
-                'name': user.name,
-                'email': user.email,
-                'location': user.location,
-                'user_type': user.user_type,
-                'created_at': user.created_at
-            }
-
-        Display.print_user_profile(user_data)
-
-        if hasattr(user, 'skills') and user.skills:
-            ProfileManager.display_skills(user.skills)
+        view = _coerce_to_view(user)
+
+        Display.print_user_profile(view)
+
+        if view.skills:
+            ProfileManager.display_skills(view.skills)
 
     @staticmethod
     def display_skills(skills):
@@ -44,6 +55,8 @@ class ProfileManager:
     @staticmethod
     def display_full_profile(user_id=None, email=None):
         """Display complete user profile by user_id or email"""
+        from models.user import get_user_by_email
+
         user = None
 
         if email:
@@ -1,6 +1,307 @@
+import json
+import sys
+import time
+from collections import OrderedDict, namedtuple
+
 from database.db_manager import DatabaseManager
 from utils.display import Display
 
+# Rows returned per page by get_activity_log and the workspace listings
+ACTIVITY_PAGE_SIZE = 50
+WORKSPACE_PAGE_SIZE = 100
+
+# Matches submissions.file_path, which is short enough to sit in an index
+MAX_FILE_PATH_LENGTH = 512
+
+# Workspace reads are cached in process for a short time; writes in this
+# module drop the affected project's entries
+WORKSPACE_CACHE_TTL = 60  # seconds
+WORKSPACE_CACHE_SIZE = 128
+
+# Milestones seeded into every new workspace: (name, description, order)
+DEFAULT_MILESTONES = (
+    ('Initial Design', 'Design phase and planning', 1),
+    ('Development', 'Core development work', 2),
+    ('Testing', 'Testing and quality assurance', 3),
+    ('Final Delivery', 'Final deliverable submission', 4),
+)
+
+# One row of a workspace listing; `role` is the viewing user's side of the project
+WorkspaceRow = namedtuple(
+    'WorkspaceRow',
+    'role project_id freelancer_id status progress_percentage created_at '
+    'job_title client_name freelancer_name'
+)
+
+# Display text for activity rows, filled from the row's meta
+_ACTIVITY_TEMPLATES = {
+    'workspace_created': 'Workspace created for application #{application_id}',
+    'deliverable_submitted': 'Deliverable v{version} submitted for milestone #{milestone_id}',
+    'milestone_approved': 'Milestone #{milestone_id} approved',
+    'revision_requested': 'Revision requested for milestone #{milestone_id}',
+    'project_disputed': 'Project marked as disputed: {reason}',
+}
+
+# SQL is kept in module constants so every call sends the exact same statement text.
+_SQL_INSERT_PROJECT = """INSERT INTO projects (job_id, freelancer_id, client_id, status, progress_percentage)
+                         VALUES (%s, %s, %s, 'active', 0)"""
+
+_SQL_INSERT_MILESTONE = """INSERT INTO milestones (project_id, milestone_name, description, status, order_number)
+                           VALUES (%s, %s, %s, 'pending', %s)"""
+
+# Milestone columns returned alongside the project by get_workspace
+_MILESTONE_COLUMNS = ('milestone_name', 'description', 'due_date', 'status', 'order_number')
+
+# STRAIGHT_JOIN pins the join order to the FROM clause so the single project
+# row drives primary-key lookups into jobs and users
+_SQL_GET_WORKSPACE = """
+    SELECT STRAIGHT_JOIN p.project_id, p.job_id, p.freelancer_id, p.client_id, p.status,
+           p.progress_percentage, p.created_at, p.completed_at,
+           j.title as job_title,
+           f.name as freelancer_name, f.email as freelancer_email,
+           c.name as client_name, c.email as client_email,
+           m.milestone_id as m_milestone_id, {milestone_columns}
+    FROM projects p
+    JOIN jobs j ON p.job_id = j.job_id
+    JOIN users f ON p.freelancer_id = f.user_id
+    JOIN users c ON p.client_id = c.user_id
+    LEFT JOIN milestones m ON m.project_id = p.project_id
+    WHERE p.project_id = %s
+    ORDER BY m.order_number
+""".format(milestone_columns=", ".join(f"m.{column} as m_{column}" for column in _MILESTONE_COLUMNS))
+
+_SQL_PROJECT_MILESTONES = """
+    SELECT milestone_id, project_id, {milestone_columns}
+    FROM milestones
+    WHERE project_id = %s
+    ORDER BY order_number
+""".format(milestone_columns=", ".join(_MILESTONE_COLUMNS))
+
+# Workspace listings page by (created_at, project_id), newest first
+_SQL_WORKSPACE_ORDER = " ORDER BY p.created_at DESC, p.project_id DESC LIMIT %s"
+_SQL_WORKSPACE_BEFORE = " AND (p.created_at, p.project_id) < (%s, %s)"
+
+# Both listings return the WorkspaceRow columns, in WorkspaceRow order
+_SQL_FREELANCER_WORKSPACES_COLUMNS = """
+    SELECT 'freelancer' as role, p.project_id, p.freelancer_id, p.status,
+           p.progress_percentage, p.created_at, j.title as job_title,
+           c.name as client_name, NULL as freelancer_name
+    FROM projects p
+    JOIN jobs j ON p.job_id = j.job_id
+    JOIN users c ON p.client_id = c.user_id
+    WHERE p.freelancer_id = %s AND p.status = 'active'
+"""
+_SQL_FREELANCER_WORKSPACES = _SQL_FREELANCER_WORKSPACES_COLUMNS + _SQL_WORKSPACE_ORDER
+_SQL_FREELANCER_WORKSPACES_BEFORE = (_SQL_FREELANCER_WORKSPACES_COLUMNS + _SQL_WORKSPACE_BEFORE
+                                     + _SQL_WORKSPACE_ORDER)
+
+_SQL_CLIENT_WORKSPACES_COLUMNS = """
+    SELECT 'client' as role, p.project_id, p.freelancer_id, p.status,
+           p.progress_percentage, p.created_at, j.title as job_title,
+           NULL as client_name, f.name as freelancer_name
+    FROM projects p
+    JOIN jobs j ON p.job_id = j.job_id
+    JOIN users f ON p.freelancer_id = f.user_id
+    WHERE p.client_id = %s
+"""
+_SQL_CLIENT_WORKSPACES = _SQL_CLIENT_WORKSPACES_COLUMNS + _SQL_WORKSPACE_ORDER
+_SQL_CLIENT_WORKSPACES_BEFORE = (_SQL_CLIENT_WORKSPACES_COLUMNS + _SQL_WORKSPACE_BEFORE
+                                 + _SQL_WORKSPACE_ORDER)
+
+_SQL_USER_WORKSPACES = (_SQL_FREELANCER_WORKSPACES_COLUMNS + "    UNION ALL"
+                        + _SQL_CLIENT_WORKSPACES_COLUMNS
+                        + "    ORDER BY created_at DESC, project_id DESC LIMIT %s")
+
+# Submitted milestones across a client's projects with their latest submission;
+# the window function ranks every pending milestone's versions in one pass
+_SQL_CLIENT_PENDING_REVIEWS = """
+    WITH pending AS (
+        SELECT p.project_id, p.created_at, j.title as job_title,
+               m.milestone_id, m.milestone_name, m.description, m.order_number
+        FROM projects p
+        JOIN jobs j ON p.job_id = j.job_id
+        JOIN milestones m ON m.project_id = p.project_id
+        WHERE p.client_id = %s AND m.status = 'submitted'
+    ),
+    latest AS (
+        SELECT s.milestone_id, s.version_number, s.deliverable_description, s.file_path,
+               ROW_NUMBER() OVER (PARTITION BY s.milestone_id
+                                  ORDER BY s.version_number DESC) as rn
+        FROM submissions s
+        JOIN pending pm ON s.milestone_id = pm.milestone_id
+    )
+    SELECT pm.project_id, pm.job_title,
+           pm.milestone_id, pm.milestone_name, pm.description,
+           l.version_number, l.deliverable_description, l.file_path
+    FROM pending pm
+    LEFT JOIN latest l ON l.milestone_id = pm.milestone_id AND l.rn = 1
+    ORDER BY pm.created_at DESC, pm.project_id, pm.order_number
+"""
+
+_SQL_LOCK_MILESTONE = """
+    SELECT m.project_id,
+           (SELECT COALESCE(MAX(s.version_number), 0)
+            FROM submissions s
+            WHERE s.milestone_id = m.milestone_id) as max_version
+    FROM milestones m
+    WHERE m.milestone_id = %s
+    FOR UPDATE
+"""
+
+_SQL_INSERT_SUBMISSION = """INSERT INTO submissions (milestone_id, deliverable_description, file_path, version_number)
+                            VALUES (%s, %s, %s, %s)"""
+
+_SQL_MARK_SUBMITTED = """
+    UPDATE milestones
+    SET status = 'submitted', claimed_by = NULL
+    WHERE milestone_id = %s AND status != 'approved'
+"""
+
+# Covered by idx_submissions_history, so the history never touches the table rows
+_SQL_SUBMISSION_HISTORY = """
+    SELECT submission_id, milestone_id, version_number, file_path, submitted_at
+    FROM submissions
+    WHERE milestone_id = %s
+    ORDER BY version_number DESC
+"""
+
+_SQL_LATEST_SUBMISSION = """
+    SELECT * FROM submissions
+    WHERE milestone_id = %s
+    ORDER BY version_number DESC
+    LIMIT 1
+"""
+
+_SQL_GET_SUBMISSION = "SELECT * FROM submissions WHERE submission_id = %s"
+
+_SQL_APPROVE_MILESTONE = "CALL sp_approve_milestone(%s, %s, %s)"
+
+# Reopens the milestone and stores the feedback on its latest submission in
+# one statement; the MAX() sits in a derived table because MySQL cannot
+# update submissions while selecting from it in a subquery
+_SQL_REQUEST_REVISION = """
+    UPDATE milestones m
+    LEFT JOIN (SELECT MAX(version_number) as version_number
+               FROM submissions WHERE milestone_id = %s) latest ON TRUE
+    LEFT JOIN submissions s
+           ON s.milestone_id = m.milestone_id
+          AND s.version_number = latest.version_number
+    SET m.status = 'revision_requested', m.claimed_by = NULL,
+        s.client_feedback = %s
+    WHERE m.milestone_id = %s
+"""
+
+_SQL_CLAIMABLE_MILESTONES = """
+    SELECT milestone_id
+    FROM milestones
+    WHERE status = 'submitted' AND claimed_by IS NULL
+    ORDER BY milestone_id
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+"""
+
+_SQL_CLAIM_MILESTONES = "UPDATE milestones SET claimed_by = %s WHERE milestone_id IN ({placeholders})"
+
+# Recounts a project's milestones and derives progress from the fresh
+# counts; multi-table SET order is not guaranteed, so nothing reads a column
+# assigned in the same statement
+_SQL_UPDATE_PROGRESS = """
+    UPDATE projects p
+    JOIN (SELECT COUNT(*) as total,
+                 COALESCE(SUM(status = 'approved'), 0) as approved
+          FROM milestones
+          WHERE project_id = %s) m ON TRUE
+    SET p.milestones_total = m.total,
+        p.milestones_approved = m.approved,
+        p.progress_percentage = IF(m.total > 0, FLOOR(m.approved * 100 / m.total), 0),
+        p.status = IF(m.total > 0 AND m.approved = m.total, 'completed', p.status),
+        p.completed_at = IF(m.total > 0 AND m.approved = m.total AND p.completed_at IS NULL,
+                            NOW(), p.completed_at)
+    WHERE p.project_id = %s
+"""
+
+_SQL_ACTIVITY_COLUMNS = """
+    SELECT a.activity_id, a.activity_type, a.meta, a.description, a.created_at,
+           u.name as user_name
+    FROM activity_log a
+    JOIN users u ON a.user_id = u.user_id
+    WHERE a.project_id = %s"""
+_SQL_ACTIVITY_PAGE = _SQL_ACTIVITY_COLUMNS + " ORDER BY a.activity_id DESC LIMIT %s"
+_SQL_ACTIVITY_PAGE_BEFORE = _SQL_ACTIVITY_COLUMNS + " AND a.activity_id < %s ORDER BY a.activity_id DESC LIMIT %s"
+
+_SQL_MARK_DISPUTED = """
+    UPDATE projects
+    SET status = 'disputed'
+    WHERE project_id = %s AND status <> 'disputed'
+"""
+
+_SQL_INSERT_ACTIVITY = """INSERT INTO activity_log (project_id, user_id, activity_type, meta, description)
+                          VALUES (%s, %s, %s, %s, %s)"""
+_SQL_LOCK_MILESTONE_PROJECT = "SELECT project_id FROM milestones WHERE milestone_id = %s FOR UPDATE"
+
+
+class _TTLCache:
+    """Small LRU cache whose entries also expire after a fixed time"""
+
+    def __init__(self, ttl, maxsize):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+
+
+_workspace_cache = _TTLCache(WORKSPACE_CACHE_TTL, WORKSPACE_CACHE_SIZE)
+_activity_log_cache = _TTLCache(WORKSPACE_CACHE_TTL, WORKSPACE_CACHE_SIZE)
+
+
+def _drop_workspace(project_id):
+    """Drop a project's cached workspace and first activity page"""
+    _workspace_cache.invalidate(project_id)
+    _activity_log_cache.invalidate(project_id)
+
+
+def _invalidate_workspace(project_id):
+    """Forget cached reads for a project after it changes
+
+    They are dropped again when the current transaction ends, so a read from
+    another thread before the commit cannot cache the old state.
+    """
+    _drop_workspace(project_id)
+    DatabaseManager.on_transaction_end(lambda: _drop_workspace(project_id))
+
+
+def _render_activity(row):
+    """Decode an activity row's meta and fill in its description when missing"""
+    meta = json.loads(row['meta']) if row.get('meta') else {}
+    row['meta'] = meta
+    if not row.get('description'):
+        template = _ACTIVITY_TEMPLATES.get(row['activity_type'])
+        try:
+            row['description'] = template.format(**meta) if template else row['activity_type']
+        except KeyError:
+            row['description'] = row['activity_type']
+    return row
+
+
 class WorkspaceManager:
     """Workspace service to integrate project management"""
 
@@ -9,333 +310,430 @@ class WorkspaceManager:
         """Auto-create project workspace when application is accepted"""
         with DatabaseManager.get_cursor() as cursor:
             # Create project workspace
-            query = """INSERT INTO projects (job_id, freelancer_id, client_id, status, progress_percentage)
-                       VALUES (%s, %s, %s, 'active', 0)"""
-            cursor.execute(query, (job_id, freelancer_id, client_id))
+            cursor.execute(_SQL_INSERT_PROJECT, (job_id, freelancer_id, client_id))
             project_id = cursor.lastrowid
 
-            # Create default milestones
-            default_milestones = [
-                ('Initial Design', 'Design phase and planning', 1),
-                ('Development', 'Core development work', 2),
-                ('Testing', 'Testing and quality assurance', 3),
-                ('Final Delivery', 'Final deliverable submission', 4)
-            ]
-
-            for milestone_name, description, order_number in default_milestones:
-                milestone_query = """INSERT INTO milestones (project_id, milestone_name, description, status, order_number)
-                                    VALUES (%s, %s, %s, 'pending', %s)"""
-                cursor.execute(milestone_query, (project_id, milestone_name, description, order_number))
+            # Create default milestones; executemany folds the rows into a
+            # single multi-row INSERT
+            cursor.executemany(_SQL_INSERT_MILESTONE, [
+                (project_id, milestone_name, description, order_number)
+                for milestone_name, description, order_number in DEFAULT_MILESTONES
+            ])
 
             # Log workspace creation
             WorkspaceManager.log_activity(
                 project_id,
                 freelancer_id,
                 'workspace_created',
-                f'Workspace created for application #{application_id}'
+                {'application_id': application_id},
+                cursor=cursor
             )
 
             return project_id
 
     @staticmethod
     def get_workspace(project_id):
-        """Get workspace details by project ID"""
+        """Get workspace details by project ID
+
+        Project and milestones come back from one query: each row carries the
+        project columns plus one milestone (prefixed with m_), split apart here.
+        """
+        cached = _workspace_cache.get(project_id)
+        if cached is not None:
+            return cached
+
         with DatabaseManager.get_cursor() as cursor:
-            # Get project details
-            cursor.execute("""
-                SELECT p.*, j.title as job_title, j.description as job_description,
-                       j.budget_min, j.budget_max, j.deadline,
-                       f.name as freelancer_name, f.email as freelancer_email,
-                       c.name as client_name, c.email as client_email
-                FROM projects p
-                JOIN jobs j ON p.job_id = j.job_id
-                JOIN users f ON p.freelancer_id = f.user_id
-                JOIN users c ON p.client_id = c.user_id
-                WHERE p.project_id = %s
-            """, (project_id,))
-            project = cursor.fetchone()
-
-            if not project:
-                return None
-
-            # Get milestones
-            cursor.execute("""
-                SELECT * FROM milestones
-                WHERE project_id = %s
-                ORDER BY order_number
-            """, (project_id,))
-            milestones = cursor.fetchall()
-
-            return {
-                'project': project,
-                'milestones': milestones
+            cursor.execute(_SQL_GET_WORKSPACE, (project_id,))
+            rows = cursor.fetchall()
+
+        if not rows:
+            return None
+
+        project = {key: value for key, value in rows[0].items() if not key.startswith('m_')}
+        milestones = [
+            {
+                'milestone_id': row['m_milestone_id'],
+                'project_id': project['project_id'],
+                **{column: row['m_' + column] for column in _MILESTONE_COLUMNS},
             }
+            for row in rows
+            if row['m_milestone_id'] is not None
+        ]
+
+        workspace = {
+            'project': project,
+            'milestones': milestones
+        }
+        _workspace_cache.put(project_id, workspace)
+        return workspace
 
     @staticmethod
-    def get_freelancer_workspaces(freelancer_id):
-        """Get all active workspaces for a freelancer"""
+    def get_milestones(project_id):
+        """Get a project's milestones in order, without the project details"""
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT p.*, j.title as job_title, c.name as client_name
-                FROM projects p
-                JOIN jobs j ON p.job_id = j.job_id
-                JOIN users c ON p.client_id = c.user_id
-                WHERE p.freelancer_id = %s AND p.status = 'active'
-                ORDER BY p.created_at DESC
-            """, (freelancer_id,))
+            cursor.execute(_SQL_PROJECT_MILESTONES, (project_id,))
             return cursor.fetchall()
 
     @staticmethod
-    def get_client_workspaces(client_id):
-        """Get all workspaces for a client"""
+    def get_freelancer_workspaces(freelancer_id, before=None, limit=WORKSPACE_PAGE_SIZE):
+        """Get a page of a freelancer's active workspaces as WorkspaceRows
+
+        Pass the last row already shown as `before` to get the next (older) page.
+        """
+        with DatabaseManager.get_cursor(dictionary=False) as cursor:
+            if before is None:
+                cursor.execute(_SQL_FREELANCER_WORKSPACES, (freelancer_id, limit))
+            else:
+                cursor.execute(_SQL_FREELANCER_WORKSPACES_BEFORE,
+                               (freelancer_id, before.created_at, before.project_id, limit))
+            return [WorkspaceRow._make(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_client_workspaces(client_id, before=None, limit=WORKSPACE_PAGE_SIZE):
+        """Get a page of a client's workspaces as WorkspaceRows
+
+        Pass the last row already shown as `before` to get the next (older) page.
+        """
+        with DatabaseManager.get_cursor(dictionary=False) as cursor:
+            if before is None:
+                cursor.execute(_SQL_CLIENT_WORKSPACES, (client_id, limit))
+            else:
+                cursor.execute(_SQL_CLIENT_WORKSPACES_BEFORE,
+                               (client_id, before.created_at, before.project_id, limit))
+            return [WorkspaceRow._make(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_user_workspaces(user_id, limit=WORKSPACE_PAGE_SIZE):
+        """Get a user's newest workspaces from both sides in one query
+
+        Same columns as get_freelancer_workspaces and get_client_workspaces,
+        at most `limit` rows newest first across both sides; each row's
+        `role` is the user's side of that project so it can go straight to
+        print_workspace_card(row, row.role).
+        """
+        with DatabaseManager.get_cursor(dictionary=False) as cursor:
+            cursor.execute(_SQL_USER_WORKSPACES, (user_id, user_id, limit))
+            return [WorkspaceRow._make(row) for row in cursor.fetchall()]
+
+    @staticmethod
+    def get_client_pending_reviews(client_id):
+        """Get a client's submitted milestones grouped by project
+
+        Returns a list of (project, milestones) pairs, where project holds
+        project_id and job_title and each milestone carries its latest
+        submission under 'latest' (None if there is none).
+        """
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT p.*, j.title as job_title, f.name as freelancer_name
-                FROM projects p
-                JOIN jobs j ON p.job_id = j.job_id
-                JOIN users f ON p.freelancer_id = f.user_id
-                WHERE p.client_id = %s
-                ORDER BY p.created_at DESC
-            """, (client_id,))
-            return cursor.fetchall()
+            cursor.execute(_SQL_CLIENT_PENDING_REVIEWS, (client_id,))
+            rows = cursor.fetchall()
+
+        grouped = OrderedDict()
+        for row in rows:
+            project_id = row['project_id']
+            if project_id not in grouped:
+                grouped[project_id] = ({'project_id': project_id, 'job_title': row['job_title']}, [])
+            latest = None
+            if row['version_number'] is not None:
+                latest = {
+                    'version_number': row['version_number'],
+                    'deliverable_description': row['deliverable_description'],
+                    'file_path': row['file_path'],
+                }
+            grouped[project_id][1].append({
+                'milestone_id': row['milestone_id'],
+                'milestone_name': row['milestone_name'],
+                'description': row['description'],
+                'latest': latest,
+            })
+        return list(grouped.values())
 
     @staticmethod
-    def submit_deliverable(milestone_id, freelancer_id, file_path=None, description=None):
-        """Submit a deliverable to a milestone with version tracking"""
+    def submit_deliverable(milestone_id, freelancer_id, file_path=None, description=None, project_id=None):
+        """Submit a deliverable to a milestone with version tracking
+
+        The version number, the submission row and the milestone's move to
+        'submitted' all happen in one transaction under a lock on the milestone.
+        """
+        if file_path and len(file_path) > MAX_FILE_PATH_LENGTH:
+            raise ValueError(f"File path must be at most {MAX_FILE_PATH_LENGTH} characters")
+
         with DatabaseManager.get_cursor() as cursor:
-            # Get current version number for this milestone
-            cursor.execute("""
-                SELECT COALESCE(MAX(version_number), 0) as max_version
-                FROM submissions
-                WHERE milestone_id = %s
-            """, (milestone_id,))
+            # Lock the milestone row so concurrent submissions get distinct
+            # versions; the same query returns the project for the activity log
+            cursor.execute(_SQL_LOCK_MILESTONE, (milestone_id,))
             result = cursor.fetchone()
+            if result is None:
+                raise ValueError(f"Milestone #{milestone_id} does not exist")
             next_version = result['max_version'] + 1
+            if project_id is None:
+                project_id = result['project_id']
 
             # Insert submission
-            query = """INSERT INTO submissions (milestone_id, deliverable_description, file_path, version_number)
-                       VALUES (%s, %s, %s, %s)"""
-            cursor.execute(query, (milestone_id, description, file_path, next_version))
+            cursor.execute(_SQL_INSERT_SUBMISSION, (milestone_id, description, file_path, next_version))
             submission_id = cursor.lastrowid
 
-            # Get project_id for activity log
-            cursor.execute("SELECT project_id FROM milestones WHERE milestone_id = %s", (milestone_id,))
-            project = cursor.fetchone()
-            project_id = project['project_id']
+            # Mark the milestone submitted in the same transaction, still under the row lock
+            cursor.execute(_SQL_MARK_SUBMITTED, (milestone_id,))
 
             # Log activity
             WorkspaceManager.log_activity(
                 project_id,
                 freelancer_id,
                 'deliverable_submitted',
-                f'Deliverable v{next_version} submitted for milestone #{milestone_id}'
+                {'milestone_id': milestone_id, 'version': next_version},
+                cursor=cursor
             )
 
             return submission_id
 
     @staticmethod
     def get_milestone_submissions(milestone_id):
-        """Get all submissions for a milestone with version history"""
+        """Get the version history of a milestone, newest first
+
+        Only the short columns are returned; use get_submission_detail for the
+        description and client feedback of a single submission.
+        """
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT * FROM submissions
-                WHERE milestone_id = %s
-                ORDER BY version_number DESC
-            """, (milestone_id,))
+            cursor.execute(_SQL_SUBMISSION_HISTORY, (milestone_id,))
             return cursor.fetchall()
 
     @staticmethod
-    def approve_milestone(milestone_id, client_id, feedback=None):
-        """Client approves a milestone"""
+    def get_latest_submission(milestone_id):
+        """Get the newest submission for a milestone, with all its details"""
         with DatabaseManager.get_cursor() as cursor:
-            # Update milestone status
-            cursor.execute("""
-                UPDATE milestones
-                SET status = 'approved'
-                WHERE milestone_id = %s
-            """, (milestone_id,))
-
-            # Add feedback to latest submission if provided
-            if feedback:
-                cursor.execute("""
-                    UPDATE submissions
-                    SET client_feedback = %s
-                    WHERE milestone_id = %s
-                    ORDER BY version_number DESC
-                    LIMIT 1
-                """, (feedback, milestone_id))
-
-            # Get project_id
-            cursor.execute("SELECT project_id FROM milestones WHERE milestone_id = %s", (milestone_id,))
-            project = cursor.fetchone()
-            project_id = project['project_id']
-
-            # Update progress percentage
-            WorkspaceManager.update_progress(project_id)
+            cursor.execute(_SQL_LATEST_SUBMISSION, (milestone_id,))
+            return cursor.fetchone()
 
-            # Log activity
-            WorkspaceManager.log_activity(
-                project_id,
-                client_id,
-                'milestone_approved',
-                f'Milestone #{milestone_id} approved'
-            )
+    @staticmethod
+    def get_submission_detail(submission_id):
+        """Get one submission including its description and client feedback"""
+        with DatabaseManager.get_cursor() as cursor:
+            cursor.execute(_SQL_GET_SUBMISSION, (submission_id,))
+            return cursor.fetchone()
 
-            return True
+    @staticmethod
+    def claim_pending_milestones(worker_id, batch=16):
+        """Claim up to `batch` submitted milestones for a review worker
+
+        SKIP LOCKED lets several workers claim at once without waiting on each
+        other's rows. A claim is cleared when the milestone is approved, sent
+        back for revision or resubmitted. Returns the claimed milestone ids.
+        """
+        with DatabaseManager.get_cursor() as cursor:
+            cursor.execute(_SQL_CLAIMABLE_MILESTONES, (batch,))
+            milestone_ids = [row['milestone_id'] for row in cursor.fetchall()]
+            if milestone_ids:
+                placeholders = ", ".join(["%s"] * len(milestone_ids))
+                cursor.execute(_SQL_CLAIM_MILESTONES.format(placeholders=placeholders),
+                               (worker_id, *milestone_ids))
+            return milestone_ids
 
     @staticmethod
-    def request_revision(milestone_id, client_id, feedback):
-        """Client requests revision on a milestone"""
+    def approve_milestone(milestone_id, client_id, feedback=None):
+        """Client approves a milestone
+
+        The status change, feedback and activity entry all run server-side in
+        sp_approve_milestone, and the milestone triggers move the project's
+        progress along (see schema.sql), so this is a single round trip.
+        Returns False if the milestone does not exist or belongs to another
+        client's project.
+        """
+        with DatabaseManager.get_cursor() as cursor:
+            cursor.execute(_SQL_APPROVE_MILESTONE, (milestone_id, client_id, feedback))
+            rows = cursor.fetchall()
+            # Drain the CALL's trailing status result before the cursor closes
+            while cursor.nextset():
+                pass
+
+        result = rows[0] if rows else None
+        if not result or result['project_id'] is None:
+            return False
+
+        _invalidate_workspace(result['project_id'])
+        if result['project_status'] == 'completed':
+            from models.portfolio import Portfolio
+            Portfolio.invalidate(result['freelancer_id'])
+        return True
+
+    @staticmethod
+    def request_revision(milestone_id, client_id, feedback, project_id=None):
+        """Client requests revision on a milestone
+
+        Pass `project_id` when the caller already has it to skip the lookup.
+        Returns False if the milestone does not exist or nothing changed.
+        """
         with DatabaseManager.get_cursor() as cursor:
-            # Update milestone status
-            cursor.execute("""
-                UPDATE milestones
-                SET status = 'revision_requested'
-                WHERE milestone_id = %s
-            """, (milestone_id,))
-
-            # Add feedback to latest submission
-            cursor.execute("""
-                UPDATE submissions
-                SET client_feedback = %s
-                WHERE milestone_id = %s
-                ORDER BY version_number DESC
-                LIMIT 1
-            """, (feedback, milestone_id))
-
-            # Get project_id
-            cursor.execute("SELECT project_id FROM milestones WHERE milestone_id = %s", (milestone_id,))
-            project = cursor.fetchone()
-            project_id = project['project_id']
+            if project_id is None:
+                # Lock the milestone while reading its project, as submit_deliverable does
+                cursor.execute(_SQL_LOCK_MILESTONE_PROJECT, (milestone_id,))
+                result = cursor.fetchone()
+                if result is None:
+                    return False
+                project_id = result['project_id']
+
+            # Reopen the milestone and attach feedback to its latest submission
+            cursor.execute(_SQL_REQUEST_REVISION, (milestone_id, feedback, milestone_id))
+            if cursor.rowcount == 0:
+                return False
 
             # Log activity
             WorkspaceManager.log_activity(
                 project_id,
                 client_id,
                 'revision_requested',
-                f'Revision requested for milestone #{milestone_id}'
+                {'milestone_id': milestone_id},
+                cursor=cursor
             )
 
             return True
 
     @staticmethod
-    def update_progress(project_id):
-        """Calculate and update progress percentage based on completed milestones"""
+    def update_progress(project_id, freelancer_id=None):
+        """Recalculate progress from approved milestones, completing the project at 100%
+
+        The milestone triggers (see schema.sql) keep the counters and progress
+        current on every milestone change; this recounts the milestones from
+        scratch to repair a project whose counters drifted or predate them.
+        A completed project keeps its original completed_at. Returns True
+        when the project row changed.
+        """
         with DatabaseManager.get_cursor() as cursor:
-            # Count total and approved milestones
-            cursor.execute("""
-                SELECT
-                    COUNT(*) as total,
-                    SUM(CASE WHEN status = 'approved' THEN 1 ELSE 0 END) as approved
-                FROM milestones
-                WHERE project_id = %s
-            """, (project_id,))
-            result = cursor.fetchone()
-
-            total = result['total']
-            approved = result['approved']
-
-            progress = int((approved / total * 100)) if total > 0 else 0
+            cursor.execute(_SQL_UPDATE_PROGRESS, (project_id, project_id))
+            changed = cursor.rowcount > 0
 
-            # Update project progress
-            cursor.execute("""
-                UPDATE projects
-                SET progress_percentage = %s
-                WHERE project_id = %s
-            """, (progress, project_id))
-
-            # If all milestones approved, mark project as completed
-            if progress == 100:
-                cursor.execute("""
-                    UPDATE projects
-                    SET status = 'completed', completed_at = NOW()
-                    WHERE project_id = %s
-                """, (project_id,))
-
-            return progress
+        # A completed project may now show up in the freelancer's portfolio;
+        # without a freelancer id every cached portfolio is dropped
+        if changed:
+            from models.portfolio import Portfolio
+            _workspace_cache.invalidate(project_id)
+            Portfolio.invalidate(freelancer_id)
+        return changed
 
     @staticmethod
-    def get_activity_log(project_id):
-        """Get activity log for a workspace"""
+    def get_activity_log(project_id, before_id=None, limit=ACTIVITY_PAGE_SIZE):
+        """Get a page of a workspace's activity log, newest first
+
+        Pass the smallest activity_id already shown as `before_id` to get the
+        next (older) page. Only the default first page is cached.
+        """
+        first_page = before_id is None and limit == ACTIVITY_PAGE_SIZE
+        if first_page:
+            cached = _activity_log_cache.get(project_id)
+            if cached is not None:
+                return cached
+
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                SELECT a.*, u.name as user_name
-                FROM activity_log a
-                JOIN users u ON a.user_id = u.user_id
-                WHERE a.project_id = %s
-                ORDER BY a.created_at DESC
-            """, (project_id,))
-            return cursor.fetchall()
+            if before_id is None:
+                cursor.execute(_SQL_ACTIVITY_PAGE, (project_id, limit))
+            else:
+                cursor.execute(_SQL_ACTIVITY_PAGE_BEFORE, (project_id, before_id, limit))
+            activity = [_render_activity(row) for row in cursor.fetchall()]
+        if first_page:
+            _activity_log_cache.put(project_id, activity)
+        return activity
 
     @staticmethod
-    def log_activity(project_id, user_id, activity_type, description):
-        """Log an activity in the workspace"""
-        with DatabaseManager.get_cursor() as cursor:
-            query = """INSERT INTO activity_log (project_id, user_id, activity_type, description)
-                       VALUES (%s, %s, %s, %s)"""
-            cursor.execute(query, (project_id, user_id, activity_type, description))
-            return cursor.lastrowid
+    def log_activity(project_id, user_id, activity_type, meta=None, description=None, cursor=None):
+        """Log an activity in the workspace
+
+        `meta` holds the structured details (ids, version, reason) and is
+        stored as JSON; `description` is optional free text; when it is left
+        out, get_activity_log renders one from the type and meta.
+
+        Pass the caller's `cursor` so the row is written in the same
+        transaction as the change it records. Every workspace write logs
+        activity, so this is also where cached reads are dropped.
+        """
+        row = (project_id, user_id, activity_type, json.dumps(meta) if meta else None, description)
+        if cursor is not None:
+            cursor.execute(_SQL_INSERT_ACTIVITY, row)
+        else:
+            with DatabaseManager.get_cursor() as cursor:
+                cursor.execute(_SQL_INSERT_ACTIVITY, row)
+        _invalidate_workspace(project_id)
 
     @staticmethod
     def mark_disputed(project_id, user_id, reason):
-        """Mark a project as disputed"""
+        """Mark a project as disputed
+
+        Returns False, and logs nothing, if the project does not exist or is
+        already disputed.
+        """
         with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("""
-                UPDATE projects
-                SET status = 'disputed'
-                WHERE project_id = %s
-            """, (project_id,))
+            cursor.execute(_SQL_MARK_DISPUTED, (project_id,))
+            if cursor.rowcount == 0:
+                return False
 
             WorkspaceManager.log_activity(
                 project_id,
                 user_id,
                 'project_disputed',
-                f'Project marked as disputed: {reason}'
+                {'reason': reason},
+                cursor=cursor
             )
 
             return True
 
     @staticmethod
     def display_workspaces(user_id, user_type):
-        """Display all workspaces for a user"""
+        """Display all workspaces for a user, a page at a time"""
         if user_type == 'freelancer':
-            workspaces = WorkspaceManager.get_freelancer_workspaces(user_id)
+            get_page = WorkspaceManager.get_freelancer_workspaces
             Display.print_header("MY ACTIVE PROJECTS")
         else:
-            workspaces = WorkspaceManager.get_client_workspaces(user_id)
+            get_page = WorkspaceManager.get_client_workspaces
             Display.print_header("MY CLIENT PROJECTS")
 
+        workspaces = get_page(user_id)
         if not workspaces:
             Display.print_warning("No active projects found")
             return
 
-        for workspace in workspaces:
-            WorkspaceManager.print_workspace_card(workspace, user_type)
+        while True:
+            for workspace in workspaces:
+                WorkspaceManager.print_workspace_card(workspace, user_type)
+            # A short page is the last one
+            if len(workspaces) < WORKSPACE_PAGE_SIZE:
+                return
+            Display.print_info(f"Showing {len(workspaces)} projects; there may be older ones.")
+            answer = Display.ask_input("Show older projects? (y/N):", allow_empty=True)
+            if answer.strip().lower() not in ('y', 'yes'):
+                return
+            workspaces = get_page(user_id, before=workspaces[-1])
+            if not workspaces:
+                Display.print_info("No older projects.")
+                return
 
     @staticmethod
     def print_workspace_card(workspace, user_type):
         """Print a formatted workspace card"""
-        project_id = workspace.get('project_id', 'N/A')
-        job_title = workspace.get('job_title', 'Untitled Project')
-        status = workspace.get('status', 'unknown')
-        progress = workspace.get('progress_percentage', 0)
-        created_at = workspace.get('created_at', 'N/A')
+        project_id = workspace.project_id
+        job_title = workspace.job_title or 'Untitled Project'
+        status = workspace.status or 'unknown'
+        progress = workspace.progress_percentage or 0
+        created_at = workspace.created_at or 'N/A'
 
         if user_type == 'freelancer':
-            partner_name = workspace.get('client_name', 'N/A')
+            partner_name = workspace.client_name or 'N/A'
             partner_label = 'Client'
         else:
-            partner_name = workspace.get('freelancer_name', 'N/A')
+            partner_name = workspace.freelancer_name or 'N/A'
             partner_label = 'Freelancer'
 
-        print("\n" + "+" + "-" * 78 + "+")
-        print(f"| {Display.color_text(f'Project #{project_id}: {job_title}', 'cyan', bold=True):<87}|")
-        print("+" + "-" * 78 + "+")
-        print(f"| {Display.color_text(partner_label + ':', 'yellow')} {partner_name}".ljust(87) + "|")
-        print(f"| {Display.color_text('Status:', 'yellow')} {Display._get_status_text(status)}".ljust(100) + "|")
-        print(f"| {Display.color_text('Progress:', 'yellow')} {progress}%".ljust(87) + "|")
-        print(f"| {Display.color_text('Created:', 'yellow')} {created_at}".ljust(87) + "|")
-        print("+" + "-" * 78 + "+\n")
+        border = "+" + "-" * 78 + "+"
+        fields = [
+            f"{Display.color_text(partner_label + ':', 'yellow')} {partner_name}",
+            f"{Display.color_text('Status:', 'yellow')} {Display._get_status_text(status)}",
+            f"{Display.color_text('Progress:', 'yellow')} {progress}%",
+            f"{Display.color_text('Created:', 'yellow')} {created_at}",
+        ]
+        # Assemble the card and write it in one go; padding skips color codes
+        lines = ["", border,
+                 f"| {Display._pad(Display.color_text(f'Project #{project_id}: {job_title}', 'cyan', bold=True), 76)} |",
+                 border]
+        lines.extend(f"| {Display._pad(field, 76)} |" for field in fields)
+        lines.extend([border, "", ""])
+        sys.stdout.write("\n".join(lines))
 
     @staticmethod
     def display_workspace_details(project_id):
@@ -387,7 +785,7 @@ class WorkspaceManager:
         # Display projects
         print("Your active projects:")
         for idx, workspace in enumerate(workspaces, start=1):
-            print(f"  [{idx}] {workspace['job_title']} (Project #{workspace['project_id']})")
+            print(f"  [{idx}] {workspace.job_title} (Project #{workspace.project_id})")
 
         # Select project
         try:
@@ -398,18 +796,13 @@ class WorkspaceManager:
                 Display.print_error("Invalid project number")
                 return
 
-            project_id = workspaces[project_choice - 1]['project_id']
+            project_id = workspaces[project_choice - 1].project_id
         except (ValueError, KeyError):
             Display.print_error("Invalid input")
             return
 
-        # Get project milestones
-        workspace = WorkspaceManager.get_workspace(project_id)
-        if not workspace:
-            Display.print_error("Project not found")
-            return
-
-        milestones = workspace['milestones']
+        # The selected row already has the project details; only the milestones are needed
+        milestones = WorkspaceManager.get_milestones(project_id)
         pending_milestones = [m for m in milestones if m['status'] in ['pending', 'revision_requested']]
 
         if not pending_milestones:
@@ -446,17 +839,10 @@ class WorkspaceManager:
         # Submit deliverable
         try:
             submission_id = WorkspaceManager.submit_deliverable(
-                milestone_id, user_id, file_path if file_path else None, description
+                milestone_id, user_id, file_path if file_path else None, description,
+                project_id=project_id
             )
 
-            # Update milestone status to submitted
-            with DatabaseManager.get_cursor() as cursor:
-                cursor.execute("""
-                    UPDATE milestones
-                    SET status = 'submitted'
-                    WHERE milestone_id = %s AND status != 'approved'
-                """, (milestone_id,))
-
             Display.print_success(f"Deliverable submitted successfully! (Submission ID: {submission_id})")
         except Exception as e:
             Display.print_error(f"Failed to submit deliverable: {str(e)}")
@@ -466,21 +852,8 @@ class WorkspaceManager:
         """Interactive flow for clients to review deliverables"""
         Display.print_header("REVIEW DELIVERABLES")
 
-        # Get client's projects
-        workspaces = WorkspaceManager.get_client_workspaces(user_id)
-
-        if not workspaces:
-            Display.print_warning("You have no projects")
-            return
-
-        # Display projects with pending reviews
-        projects_with_submissions = []
-        for workspace in workspaces:
-            project_data = WorkspaceManager.get_workspace(workspace['project_id'])
-            if project_data:
-                submitted_milestones = [m for m in project_data['milestones'] if m['status'] == 'submitted']
-                if submitted_milestones:
-                    projects_with_submissions.append((workspace, submitted_milestones))
+        # Projects with submitted milestones and their latest submissions
+        projects_with_submissions = WorkspaceManager.get_client_pending_reviews(user_id)
 
         if not projects_with_submissions:
             Display.print_warning("No pending deliverables to review")
@@ -512,9 +885,8 @@ class WorkspaceManager:
             print(f"      {milestone['description']}")
 
             # Show latest submission
-            submissions = WorkspaceManager.get_milestone_submissions(milestone['milestone_id'])
-            if submissions:
-                latest = submissions[0]
+            latest = milestone['latest']
+            if latest:
                 print(f"      Latest submission (v{latest['version_number']}): {latest['deliverable_description']}")
                 if latest['file_path']:
                     print(f"      File: {latest['file_path']}")
@@ -545,16 +917,22 @@ class WorkspaceManager:
         if review_choice == "1":
             feedback = Display.ask_input("Feedback (optional):", allow_empty=True)
             try:
-                WorkspaceManager.approve_milestone(milestone_id, user_id, feedback if feedback else None)
-                Display.print_success(f"Milestone '{selected_milestone['milestone_name']}' approved!")
+                if WorkspaceManager.approve_milestone(milestone_id, user_id, feedback if feedback else None):
+                    Display.print_success(f"Milestone '{selected_milestone['milestone_name']}' approved!")
+                else:
+                    Display.print_error("Milestone not found in your projects")
             except Exception as e:
                 Display.print_error(f"Failed to approve milestone: {str(e)}")
 
         elif review_choice == "2":
             feedback = Display.ask_input("Revision feedback (required):", allow_empty=False)
             try:
-                WorkspaceManager.request_revision(milestone_id, user_id, feedback)
-                Display.print_success(f"Revision requested for '{selected_milestone['milestone_name']}'")
+                if WorkspaceManager.request_revision(
+                    milestone_id, user_id, feedback, project_id=selected_workspace['project_id']
+                ):
+                    Display.print_success(f"Revision requested for '{selected_milestone['milestone_name']}'")
+                else:
+                    Display.print_error("Milestone not found or already awaiting revision")
             except Exception as e:
                 Display.print_error(f"Failed to request revision: {str(e)}")
         else:
@@ -1,16 +1,13 @@
-"""Entry point for the SeekIT prototype CLI."""
-
-from typing import Optional
-
-from features.application_manager import application_manager_menu
-from features.auth import list_users_flow, login_user_flow, register_user_flow
-from features.freelancer_browser import freelancer_browser_menu
-from features.job_posting import job_posting_menu
-from features.job_search import job_search_menu
-from features.profile import ProfileManager
-from features.portfolio import PortfolioManager
-from features.workspace import WorkspaceManager
-from models.user import User
+"""Entry point for the SeekIT prototype CLI.
+
+Feature modules are imported in the menu branch that uses them, so starting
+the CLI does not load every feature (or the database driver) up front.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
 from utils.display import (
     Display,
     ask_input,
@@ -20,9 +17,14 @@ from utils.display import (
     print_success,
 )
 
+if TYPE_CHECKING:
+    from models.user import User
+
 
 def profile_menu(user: User) -> None:
     """Display profile management menu."""
+    from features.profile import ProfileManager
+
     while True:
         Display.clear_screen()
         ProfileManager.show_profile_menu(user)
@@ -55,6 +57,9 @@ def profile_menu(user: User) -> None:
 
 def portfolio_menu(user: User) -> None:
     """Display portfolio management menu."""
+    from features.portfolio import PortfolioManager
+    from models.portfolio import Portfolio
+
     while True:
         Display.clear_screen()
         PortfolioManager.show_portfolio_menu()
@@ -69,19 +74,16 @@ def portfolio_menu(user: User) -> None:
             Display.pause()
         elif choice == "2":
             Display.clear_screen()
-            from models.portfolio import Portfolio
             stats = Portfolio.get_stats(user.user_id)
             PortfolioManager.display_stats(stats)
             Display.pause()
         elif choice == "3":
             Display.clear_screen()
-            from models.portfolio import Portfolio
             projects = Portfolio.get_by_freelancer(user.user_id)
             PortfolioManager.display_projects(projects)
             Display.pause()
         elif choice == "4":
             Display.clear_screen()
-            from models.portfolio import Portfolio
             reviews = Portfolio.get_reviews(user.user_id)
             PortfolioManager.display_reviews(reviews)
             Display.pause()
@@ -95,6 +97,8 @@ def portfolio_menu(user: User) -> None:
 
 def workspace_menu(user: User) -> None:
     """Display workspace management menu."""
+    from features.workspace import WorkspaceManager
+
     while True:
         Display.clear_screen()
         WorkspaceManager.show_workspace_menu(user.user_type)
@@ -161,6 +165,7 @@ def main() -> None:
             break
 
         if choice == "1":
+            from features.auth import register_user_flow
             user = register_user_flow()
             if user:
                 current_user = user
@@ -168,6 +173,7 @@ def main() -> None:
             if current_user:
                 print_info("You are already logged in. Log out first to switch users.")
             else:
+                from features.auth import login_user_flow
                 user = login_user_flow()
                 if user:
                     current_user = user
@@ -175,6 +181,7 @@ def main() -> None:
             if not current_user:
                 print_info("Log in to view registered users.")
             else:
+                from features.auth import list_users_flow
                 list_users_flow()
         elif choice == "4":
             if current_user:
@@ -183,11 +190,13 @@ def main() -> None:
             else:
                 print_info("No user is logged in.")
         elif choice == "5":
+            from features.job_search import job_search_menu
             job_search_menu()
         elif choice == "6":
             if not current_user:
                 print_info("Log in to manage applications.")
             else:
+                from features.application_manager import application_manager_menu
                 application_manager_menu(current_user)
         elif choice == "7":
             if not current_user:
@@ -195,6 +204,7 @@ def main() -> None:
             elif current_user.user_type != "client":
                 print_info("Only client accounts can post or review jobs.")
             else:
+                from features.job_posting import job_posting_menu
                 job_posting_menu(
                     {
                         "user_id": current_user.user_id,
@@ -225,6 +235,7 @@ def main() -> None:
             elif current_user.user_type != "client":
                 print_info("Only client accounts can browse freelancers.")
             else:
+                from features.freelancer_browser import freelancer_browser_menu
                 freelancer_browser_menu(
                     {
                         "user_id": current_user.user_id,
@@ -1,16 +1,37 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
 from database.db_manager import DatabaseManager
+from models.job import LIST_PAGE_SIZE, Job
+
+# Application rows looked up by id, least recently used evicted first;
+# entries also expire so writes from other processes show up
+APPLICATION_CACHE_SIZE = 1024
+APPLICATION_CACHE_TTL = 60  # seconds
+_application_rows = OrderedDict()  # application_id -> (loaded_at, row)
+
+
+def _drop_application_rows(application_id):
+    """Forget the cached row for an application, or every one when None"""
+    if application_id is None:
+        _application_rows.clear()
+    else:
+        _application_rows.pop(application_id, None)
 
+
+@dataclass(slots=True)
 class Application:
     """Application model for freelancer job applications"""
 
-    def __init__(self, application_id=None, job_id=None, freelancer_id=None,
-                 cover_letter=None, status='pending', applied_at=None):
-        self.application_id = application_id
-        self.job_id = job_id
-        self.freelancer_id = freelancer_id
-        self.cover_letter = cover_letter
-        self.status = status  # 'pending', 'accepted', 'rejected'
-        self.applied_at = applied_at
+    application_id: Optional[int] = None
+    job_id: Optional[int] = None
+    freelancer_id: Optional[int] = None
+    cover_letter: Optional[str] = None
+    status: str = 'pending'  # 'pending', 'accepted', 'rejected'
+    applied_at: Optional[datetime] = None
 
     def save(self):
         """Save or update application"""
@@ -20,6 +41,7 @@ class Application:
                            cover_letter=%s, status=%s WHERE application_id=%s"""
                 cursor.execute(query, (self.job_id, self.freelancer_id,
                                      self.cover_letter, self.status, self.application_id))
+                Application.invalidate(self.application_id)
             else:
                 query = """INSERT INTO applications (job_id, freelancer_id, cover_letter, status)
                            VALUES (%s, %s, %s, %s)"""
@@ -30,36 +52,63 @@ class Application:
 
     @classmethod
     def find_by_id(cls, application_id):
-        """Find application by ID"""
+        """Find application by ID (cached per application)"""
+        entry = _application_rows.get(application_id)
+        if entry is not None:
+            loaded_at, row = entry
+            if time.monotonic() - loaded_at <= APPLICATION_CACHE_TTL:
+                _application_rows.move_to_end(application_id)
+                return cls(**row)
+            del _application_rows[application_id]
+
         with DatabaseManager.get_cursor() as cursor:
             cursor.execute("SELECT * FROM applications WHERE application_id = %s", 
                          (application_id,))
             result = cursor.fetchone()
-            return cls(**result) if result else None
+        if result is None:
+            return None
+        _application_rows[application_id] = (time.monotonic(), result)
+        if len(_application_rows) > APPLICATION_CACHE_SIZE:
+            _application_rows.popitem(last=False)
+        return cls(**result)
+
+    @classmethod
+    def invalidate(cls, application_id=None):
+        """Drop the cached row for an application, or every one when None.
+
+        The row is dropped again when the current transaction ends, so a read
+        from another thread before the commit cannot cache the old row.
+        """
+        _drop_application_rows(application_id)
+        DatabaseManager.on_transaction_end(lambda: _drop_application_rows(application_id))
 
     @classmethod
-    def get_by_job(cls, job_id, status=None):
-        """Get all applications for a specific job"""
+    def get_by_job(cls, job_id, status=None, limit=LIST_PAGE_SIZE, offset=0):
+        """Get a page of applications for a specific job, newest first"""
         with DatabaseManager.get_cursor() as cursor:
             if status:
                 cursor.execute("""SELECT * FROM applications WHERE job_id = %s AND status = %s
-                               ORDER BY applied_at DESC""", (job_id, status))
+                               ORDER BY applied_at DESC LIMIT %s OFFSET %s""",
+                               (job_id, status, limit, offset))
             else:
                 cursor.execute("""SELECT * FROM applications WHERE job_id = %s
-                               ORDER BY applied_at DESC""", (job_id,))
+                               ORDER BY applied_at DESC LIMIT %s OFFSET %s""",
+                               (job_id, limit, offset))
             results = cursor.fetchall()
             return [cls(**row) for row in results]
 
     @classmethod
-    def get_by_freelancer(cls, freelancer_id, status=None):
-        """Get all applications by a specific freelancer"""
+    def get_by_freelancer(cls, freelancer_id, status=None, limit=LIST_PAGE_SIZE, offset=0):
+        """Get a page of applications by a specific freelancer, newest first"""
         with DatabaseManager.get_cursor() as cursor:
             if status:
                 cursor.execute("""SELECT * FROM applications WHERE freelancer_id = %s AND status = %s
-                               ORDER BY applied_at DESC""", (freelancer_id, status))
+                               ORDER BY applied_at DESC LIMIT %s OFFSET %s""",
+                               (freelancer_id, status, limit, offset))
             else:
                 cursor.execute("""SELECT * FROM applications WHERE freelancer_id = %s
-                               ORDER BY applied_at DESC""", (freelancer_id,))
+                               ORDER BY applied_at DESC LIMIT %s OFFSET %s""",
+                               (freelancer_id, limit, offset))
             results = cursor.fetchall()
             return [cls(**row) for row in results]
 
@@ -73,15 +122,24 @@ class Application:
             return cls(**result) if result else None
 
     def accept(self):
-        """Accept application and auto-create workspace"""
+        """Accept application and auto-create workspace.
+
+        Returns the new project id, or False when the application or its job
+        no longer exists.
+        """
         from features.workspace import WorkspaceManager
 
-        self.status = 'accepted'
-        self.save()
+        job = Job.find_row(self.job_id)
+        if not job:
+            return False
 
-        # Get job details to extract client_id
-        job = self.get_job_details()
-        if job:
+        # One transaction for the status change and the workspace
+        with DatabaseManager.get_cursor() as cursor:
+            cursor.execute("UPDATE applications SET status = %s WHERE application_id = %s",
+                           ('accepted', self.application_id))
+            if cursor.rowcount == 0:
+                return False
+            Application.invalidate(self.application_id)
             # Auto-create workspace
             project_id = WorkspaceManager.create_workspace(
                 application_id=self.application_id,
@@ -89,15 +147,13 @@ class Application:
                 freelancer_id=self.freelancer_id,
                 client_id=job['client_id']
             )
-            return project_id
 
-        return self.application_id
+        self.status = 'accepted'
+        return project_id
 
     def get_job_details(self):
         """Get job details for this application"""
-        with DatabaseManager.get_cursor() as cursor:
-            cursor.execute("SELECT * FROM jobs WHERE job_id = %s", (self.job_id,))
-            return cursor.fetchone()
+        return Job.find_row(self.job_id)
 
     def reject(self):
         """Reject application"""
@@ -111,6 +167,7 @@ class Application:
         with DatabaseManager.get_cursor() as cursor:
             cursor.execute("DELETE FROM applications WHERE application_id = %s", 
                          (self.application_id,))
+            Application.invalidate(self.application_id)
             return cursor.rowcount > 0
 
     def to_dict(self):
@@ -1,48 +1,128 @@
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
 from database.db_manager import DatabaseManager
 
+# Columns written by Job.save; INSERT and UPDATE are both built from this
+_JOB_COLUMNS = ("client_id", "title", "description", "required_skills",
+                "budget_min", "budget_max", "deadline", "status")
+_SQL_INSERT_JOB = "INSERT INTO jobs ({}) VALUES ({})".format(
+    ", ".join(_JOB_COLUMNS), ", ".join(["%s"] * len(_JOB_COLUMNS)))
+_SQL_UPDATE_JOB = "UPDATE jobs SET {} WHERE job_id=%s".format(
+    ", ".join(f"{column}=%s" for column in _JOB_COLUMNS))
+
+# Job rows looked up by id, least recently used evicted first; entries also
+# expire so writes from other processes show up
+JOB_CACHE_SIZE = 1024
+JOB_CACHE_TTL = 60  # seconds
+_job_rows = OrderedDict()  # job_id -> (loaded_at, row)
+
+# Most rows a single search returns
+SEARCH_PAGE_SIZE = 100
+
+# Default page size for the list methods
+LIST_PAGE_SIZE = 40
+
+# Keywords that are not a single indexed token (shorter than InnoDB's
+# innodb_ft_min_token_size, on its default stopword list, or containing
+# punctuation the parser splits on) fall back to LIKE
+FULLTEXT_MIN_TOKEN_SIZE = 3
+FULLTEXT_STOPWORDS = frozenset((
+    'a', 'about', 'an', 'are', 'as', 'at', 'be', 'by', 'com', 'de', 'en', 'for',
+    'from', 'how', 'i', 'in', 'is', 'it', 'la', 'of', 'on', 'or', 'that', 'the',
+    'this', 'to', 'was', 'what', 'when', 'where', 'who', 'will', 'with', 'und', 'www',
+))
+_JOB_FULLTEXT = "MATCH(title, description, required_skills) AGAINST (%s IN BOOLEAN MODE)"
+
+
+def _drop_job_rows(job_id):
+    """Forget the cached row for a job, or every one when None"""
+    if job_id is None:
+        _job_rows.clear()
+    else:
+        _job_rows.pop(job_id, None)
+
+
+@dataclass(slots=True)
 class Job:
     """Job model for client job postings"""
 
-    def __init__(self,job_id=None,client_id=None,title=None,description=None,required_skills=None,budget_min=None,budget_max=None,deadline=None, status='open',created_at=None):
-        self.job_id = job_id
-        self.client_id = client_id
-        self.title = title
-        self.description = description
-        self.required_skills = required_skills
-        self.budget_min = budget_min
-        self.budget_max = budget_max
-        self.deadline = deadline
-        self.status = status # 'open','closed', 'in_progress'
-        self.created_at = created_at
-    
+    job_id: Optional[int] = None
+    client_id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    required_skills: Optional[str] = None
+    budget_min: Optional[Decimal] = None
+    budget_max: Optional[Decimal] = None
+    deadline: Optional[date] = None
+    status: str = 'open'  # 'open','closed', 'in_progress'
+    created_at: Optional[datetime] = None
+
     def save(self):
         """Save or update job"""
         with DatabaseManager.get_cursor() as cursor:
+            values = tuple(getattr(self, column) for column in _JOB_COLUMNS)
             if self.job_id:
-                query = """UPDATE jobs SET client_id=%s, title=%s, description=%s, required_skills=%s, budget_min=%s, budget_max=%s, daedline=%s, status=%s WHERE job_id=%s"""
-                cursor.execute(query,(self.client_id,self.title,self.description,self.required_skills,self.budget_min,self.budget_max,self.deadline,self.status,self.job_id))
+                cursor.execute(_SQL_UPDATE_JOB, values + (self.job_id,))
+                Job.invalidate(self.job_id)
+                # Completed projects show the job title and skills in portfolios
+                from models.portfolio import Portfolio
+                Portfolio.invalidate()
             else:
-                query = """INSERT INTO jobs (client_id,title,description,required_skills,budget_min,budget_max,deadline,status) VALUES (%s,%s,%s,%s,%s,%s,%s,%s)"""
-                cursor.execute(query,(self.client_id,self.title,self.description,self.required_skills,self.budget_min,self.budget_max,self.deadline,self.status))
+                cursor.execute(_SQL_INSERT_JOB, values)
                 self.job_id = cursor.lastrowid
             return self.job_id
     
     @classmethod
-    def find_by_id(cls,job_id):
-        """Find job by ID"""
+    def find_row(cls, job_id):
+        """Get a job's row as a dictionary (cached per job)"""
+        entry = _job_rows.get(job_id)
+        if entry is not None:
+            loaded_at, row = entry
+            if time.monotonic() - loaded_at <= JOB_CACHE_TTL:
+                _job_rows.move_to_end(job_id)
+                return dict(row)
+            del _job_rows[job_id]
+
         with DatabaseManager.get_cursor() as cursor:
             cursor.execute("SELECT * FROM jobs WHERE job_id=%s",(job_id,))
-            result = cursor.fetchone()
-            return cls(**result) if result else None
+            row = cursor.fetchone()
+        if row is None:
+            return None
+        _job_rows[job_id] = (time.monotonic(), row)
+        if len(_job_rows) > JOB_CACHE_SIZE:
+            _job_rows.popitem(last=False)
+        return dict(row)
+
+    @classmethod
+    def find_by_id(cls,job_id):
+        """Find job by ID"""
+        result = cls.find_row(job_id)
+        return cls(**result) if result else None
+
+    @classmethod
+    def invalidate(cls, job_id=None):
+        """Drop the cached row for a job, or every one when None.
+
+        The row is dropped again when the current transaction ends, so a read
+        from another thread before the commit cannot cache the old row.
+        """
+        _drop_job_rows(job_id)
+        DatabaseManager.on_transaction_end(lambda: _drop_job_rows(job_id))
     
     @classmethod
-    def get_all(cls,status=None):
-        """Get all jobs, optionally filtered by status"""
+    def get_all(cls,status=None,limit=LIST_PAGE_SIZE,offset=0):
+        """Get a page of jobs, newest first, optionally filtered by status"""
         with DatabaseManager.get_cursor() as cursor:
             if status:
-                cursor.execute("SELECT * FROM jobs WHERE status=%s ORDER BY created_at DESC",(status,))
+                cursor.execute("SELECT * FROM jobs WHERE status=%s ORDER BY created_at DESC LIMIT %s OFFSET %s",
+                               (status,limit,offset))
             else:
-                cursor.execute("SELECT * FROM jobs ORDER BY created_at DESC")
+                cursor.execute("SELECT * FROM jobs ORDER BY created_at DESC LIMIT %s OFFSET %s",(limit,offset))
             results = cursor.fetchall()
             return [cls(**row) for row in results]
     
@@ -54,14 +134,36 @@ class Job:
             results = cursor.fetchall()
             return [cls(**row) for row in results]
 
-    def search(self,keywords=None,min_budget=None,max_budget=None):
-        """Search jobs by keywords and budget range"""
+    def search(self,keywords=None,min_budget=None,max_budget=None,limit=SEARCH_PAGE_SIZE):
+        """Search jobs by keywords and budget range
+
+        `keywords` may be a string or a list of terms; every term has to appear
+        in the title, description or required skills. At most `limit` jobs
+        are returned, best matches first.
+        """
+        if isinstance(keywords, str):
+            keywords = keywords.split()
+        # Indexable keywords become one required prefix term each in a single
+        # FULLTEXT match; the rest keep the substring LIKE
+        terms = []
+        like_keywords = []
+        for keyword in keywords or ():
+            if (keyword.isalnum() and len(keyword) >= FULLTEXT_MIN_TOKEN_SIZE
+                    and keyword.lower() not in FULLTEXT_STOPWORDS):
+                terms.append(f"+{keyword}*")
+            else:
+                like_keywords.append(keyword)
+        against = " ".join(terms)
+
         with DatabaseManager.get_cursor() as cursor:
             query = "SELECT * FROM jobs WHERE status = 'open'"
             params = []
-            if keywords:
+            if against:
+                query += " AND " + _JOB_FULLTEXT
+                params.append(against)
+            for keyword in like_keywords:
                 query += " AND (title LIKE %s OR description LIKE %s OR required_skills LIKE %s)"
-                keyword_pattern = f"%{keywords}%"
+                keyword_pattern = f"%{keyword}%"
                 params.extend([keyword_pattern,keyword_pattern,keyword_pattern])
             if min_budget:
                 query += " AND budget_max >= %s"
@@ -69,11 +171,18 @@ class Job:
             if max_budget:
                 query += " AND budget_min <= %s"
                 params.append(max_budget)
-            
-            query += " ORDER BY created_at DESC"
+
+            if against:
+                # Best matches first, newest first among equals
+                query += " ORDER BY " + _JOB_FULLTEXT + " DESC, created_at DESC"
+                params.append(against)
+            else:
+                query += " ORDER BY created_at DESC"
+            query += " LIMIT %s"
+            params.append(limit)
             cursor.execute(query,tuple(params))
-            results = cursor.fetchall()
-            return [Job(**row) for row in results]
+            return [Job(**row) for row in cursor.fetchall()]
+
     def get_applications(self):
         """Get all applications for this job"""
         with DatabaseManager.get_cursor() as cursor:
@@ -87,6 +196,7 @@ class Job:
             return False
         with DatabaseManager.get_cursor() as cursor:
             cursor.execute("UPDATE jobs SET status = 'closed' WHERE job_id = %s", (self.job_id,))
+            Job.invalidate(self.job_id)
             self.status = 'closed'
             return cursor.rowcount > 0
 
@@ -96,6 +206,7 @@ class Job:
             return False
         with DatabaseManager.get_cursor() as cursor:
             cursor.execute("DELETE FROM jobs WHERE job_id = %s", (self.job_id,))
+            Job.invalidate(self.job_id)
             return cursor.rowcount > 0
 
     def to_dict(self):
@@ -1,95 +1,179 @@
+import time
+from collections import OrderedDict
+
 from database.db_manager import DatabaseManager
 
+# Portfolio bundles kept in memory, least recently used evicted first; entries
+# also expire so writes from other processes show up
+PORTFOLIO_CACHE_SIZE = 64
+PORTFOLIO_CACHE_TTL = 60  # seconds
+_bundles = OrderedDict()  # freelancer_id -> (loaded_at, bundle)
+
+# Portfolio queries; every placeholder is the freelancer id
+_SQL_PROJECTS = """
+    SELECT
+        p.project_id,
+        p.freelancer_id,
+        p.client_id,
+        j.title,
+        j.description,
+        j.required_skills,
+        p.created_at,
+        p.completed_at,
+        r.review_id,
+        r.rating,
+        r.comment as review_comment
+    FROM projects p
+    JOIN jobs j ON p.job_id = j.job_id
+    LEFT JOIN reviews r ON p.project_id = r.project_id AND r.reviewee_id = %s
+    WHERE p.freelancer_id = %s AND p.status = 'completed'
+    ORDER BY p.completed_at DESC
+"""
+
+_SQL_REVIEWS = """
+    SELECT
+        r.review_id,
+        r.project_id,
+        r.rating,
+        r.comment,
+        r.created_at,
+        u.name as reviewer_name
+    FROM reviews r
+    JOIN users u ON r.reviewer_id = u.user_id
+    WHERE r.reviewee_id = %s
+    ORDER BY r.created_at DESC
+"""
+
+# Both in one multi-statement round trip, read back with nextset()
+_SQL_BUNDLE = ";".join((_SQL_PROJECTS, _SQL_REVIEWS))
+_BUNDLE_PARAMS = _SQL_BUNDLE.count('%s')
+
+
+def _flatten_skills(rows):
+    """Turn required_skills rows into a list of distinct skill names"""
+    skills = {
+        skill.strip()
+        for row in rows if row['required_skills']
+        for skill in row['required_skills'].split(',')
+    }
+    skills.discard('')
+    return list(skills)
+
+
+def _drop_bundles(freelancer_id):
+    """Forget the cached portfolio for a freelancer, or every one when None"""
+    if freelancer_id is None:
+        _bundles.clear()
+    else:
+        _bundles.pop(freelancer_id, None)
+
+
+def _project_stats(rows):
+    """Aggregate completed project rows into the portfolio statistics"""
+    ratings = [row['rating'] for row in rows if row['rating'] is not None]
+    return {
+        'total_projects': len(rows),
+        'average_rating': sum(ratings) / len(ratings) if ratings else None,
+        'total_reviews': sum(1 for row in rows if row['review_id'] is not None)
+    }
+
 
 class Portfolio:
     """Portfolio model - builds portfolio from completed projects and reviews"""
 
+    @classmethod
+    def _cached(cls, freelancer_id):
+        """Return the cached portfolio bundle if it is still fresh, else None"""
+        entry = _bundles.get(freelancer_id)
+        if entry is None:
+            return None
+        loaded_at, bundle = entry
+        if time.monotonic() - loaded_at > PORTFOLIO_CACHE_TTL:
+            del _bundles[freelancer_id]
+            return None
+        _bundles.move_to_end(freelancer_id)
+        return bundle
+
     @classmethod
     def get_by_freelancer(cls, freelancer_id):
         """Get portfolio for a freelancer based on completed projects"""
+        bundle = cls._cached(freelancer_id)
+        if bundle is not None:
+            return bundle['projects']
+        return cls._query_projects(freelancer_id)
+
+    @classmethod
+    def _query_projects(cls, freelancer_id):
+        """Run the completed projects query for a freelancer"""
         with DatabaseManager.get_cursor() as cursor:
-            query = """
-                SELECT
-                    p.project_id,
-                    p.freelancer_id,
-                    p.client_id,
-                    j.title,
-                    j.description,
-                    j.required_skills,
-                    p.created_at,
-                    p.completed_at,
-                    r.rating,
-                    r.comment as review_comment
-                FROM projects p
-                JOIN jobs j ON p.job_id = j.job_id
-                LEFT JOIN reviews r ON p.project_id = r.project_id AND r.reviewee_id = %s
-                WHERE p.freelancer_id = %s AND p.status = 'completed'
-                ORDER BY p.completed_at DESC
-            """
-            cursor.execute(query, (freelancer_id, freelancer_id))
+            cursor.execute(_SQL_PROJECTS, (freelancer_id, freelancer_id))
             return cursor.fetchall()
 
     @classmethod
     def get_stats(cls, freelancer_id):
-        """Get portfolio statistics for a freelancer"""
-        with DatabaseManager.get_cursor() as cursor:
-            stats_query = """
-                SELECT
-                    COUNT(p.project_id) as total_projects,
-                    AVG(r.rating) as average_rating,
-                    COUNT(r.review_id) as total_reviews
-                FROM projects p
-                LEFT JOIN reviews r ON p.project_id = r.project_id AND r.reviewee_id = %s
-                WHERE p.freelancer_id = %s AND p.status = 'completed'
-            """
-            cursor.execute(stats_query, (freelancer_id, freelancer_id))
-            return cursor.fetchone()
+        """Get portfolio statistics, reusing a cached portfolio when there is one"""
+        bundle = cls._cached(freelancer_id)
+        if bundle is not None:
+            return bundle['stats']
+        return _project_stats(cls._query_projects(freelancer_id))
 
     @classmethod
     def get_skills_summary(cls, freelancer_id):
         """Get summary of skills from completed projects"""
-        with DatabaseManager.get_cursor() as cursor:
-            skills_query = """
-                SELECT DISTINCT j.required_skills
-                FROM projects p
-                JOIN jobs j ON p.job_id = j.job_id
-                WHERE p.freelancer_id = %s AND p.status = 'completed'
-            """
-            cursor.execute(skills_query, (freelancer_id,))
-            results = cursor.fetchall()
-            all_skills = []
-            for row in results:
-                if row['required_skills']:
-                    all_skills.extend(row['required_skills'].split(','))
-            return list(set(skill.strip() for skill in all_skills))
+        bundle = cls._cached(freelancer_id)
+        if bundle is not None:
+            return bundle['skills']
+        return _flatten_skills(cls._query_projects(freelancer_id))
 
     @classmethod
     def get_reviews(cls, freelancer_id):
         """Get all reviews for a freelancer"""
+        bundle = cls._cached(freelancer_id)
+        if bundle is not None:
+            return bundle['reviews']
+        return cls._query_reviews(freelancer_id)
+
+    @classmethod
+    def _query_reviews(cls, freelancer_id):
+        """Run the reviews query for a freelancer"""
         with DatabaseManager.get_cursor() as cursor:
-            reviews_query = """
-                SELECT
-                    r.review_id,
-                    r.project_id,
-                    r.rating,
-                    r.comment,
-                    r.created_at,
-                    u.name as reviewer_name
-                FROM reviews r
-                JOIN users u ON r.reviewer_id = u.user_id
-                WHERE r.reviewee_id = %s
-                ORDER BY r.created_at DESC
-            """
-            cursor.execute(reviews_query, (freelancer_id,))
+            cursor.execute(_SQL_REVIEWS, (freelancer_id,))
             return cursor.fetchall()
 
     @classmethod
     def to_dict(cls, freelancer_id):
-        """Get complete portfolio as dictionary"""
-        return {
+        """Get complete portfolio as dictionary (cached per freelancer)"""
+        bundle = cls._cached(freelancer_id)
+        if bundle is not None:
+            return bundle
+
+        with DatabaseManager.get_cursor() as cursor:
+            cursor.execute(_SQL_BUNDLE, (freelancer_id,) * _BUNDLE_PARAMS)
+            results = [cursor.fetchall()]
+            while cursor.nextset():
+                results.append(cursor.fetchall())
+        projects, reviews = results
+
+        # Stats and skills come from the completed project rows, so the
+        # projects/reviews join is only scanned once
+        bundle = {
             'freelancer_id': freelancer_id,
-            'projects': cls.get_by_freelancer(freelancer_id),
-            'stats': cls.get_stats(freelancer_id),
-            'skills': cls.get_skills_summary(freelancer_id),
-            'reviews': cls.get_reviews(freelancer_id)
-        }
\ No newline at end of file
+            'projects': projects,
+            'stats': _project_stats(projects),
+            'skills': _flatten_skills(projects),
+            'reviews': reviews
+        }
+        _bundles[freelancer_id] = (time.monotonic(), bundle)
+        if len(_bundles) > PORTFOLIO_CACHE_SIZE:
+            _bundles.popitem(last=False)
+        return bundle
+
+    @classmethod
+    def invalidate(cls, freelancer_id=None):
+        """Drop the cached portfolio for a freelancer, or every one when None.
+
+        The bundle is dropped again when the current transaction ends, so a
+        read from another thread before the commit cannot cache old data.
+        """
+        _drop_bundles(freelancer_id)
+        DatabaseManager.on_transaction_end(lambda: _drop_bundles(freelancer_id))
@@ -1,10 +1,12 @@
 from database.db_manager import DatabaseManager
+from models.portfolio import Portfolio
 
 class Project:
     """Project model for active freelance projects"""
 
     def __init__(self, project_id=None, job_id=None, freelancer_id=None, client_id=None,
-                 status='active', progress_percentage=0, created_at=None, completed_at=None):
+                 status='active', progress_percentage=0, created_at=None, completed_at=None,
+                 milestones_total=0, milestones_approved=0):
         self.project_id = project_id
         self.job_id = job_id
         self.freelancer_id = freelancer_id
@@ -13,6 +15,9 @@ class Project:
         self.progress_percentage = progress_percentage
         self.created_at = created_at
         self.completed_at = completed_at
+        # Maintained by the milestone triggers in schema.sql
+        self.milestones_total = milestones_total
+        self.milestones_approved = milestones_approved
 
     def save(self):
         """Save or update project"""
@@ -29,7 +34,8 @@ class Project:
                 cursor.execute(query, (self.job_id, self.freelancer_id, self.client_id,
                                      self.status, self.progress_percentage))
                 self.project_id = cursor.lastrowid
-            return self.project_id
+        Portfolio.invalidate(self.freelancer_id)
+        return self.project_id
 
     @classmethod
     def find_by_id(cls, project_id):
@@ -106,7 +112,9 @@ class Project:
             return False
         with DatabaseManager.get_cursor() as cursor:
             cursor.execute("DELETE FROM projects WHERE project_id = %s", (self.project_id,))
-            return cursor.rowcount > 0
+            deleted = cursor.rowcount > 0
+        Portfolio.invalidate(self.freelancer_id)
+        return deleted
 
     def to_dict(self):
         """Convert project to dictionary"""
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from database.db_manager import DatabaseManager
 from utils.security import verify_password
@@ -110,7 +110,7 @@ def list_users(user_type: Optional[str] = None) -> List[User]:
             cursor.execute("SELECT * FROM users ORDER BY created_at DESC")
 
         rows = cursor.fetchall()
-        return [_build_user(cursor, row) for row in rows]
+        return _build_users(cursor, rows)
 
 
 def find_freelancers_by_skills(required_skills: List[str]) -> List[User]:
@@ -120,18 +120,19 @@ def find_freelancers_by_skills(required_skills: List[str]) -> List[User]:
 
     with DatabaseManager.get_cursor() as cursor:
         # Build a query to find freelancers with matching skills
-        placeholders = ", ".join(["%s"] * len(required_skills))
+        normalized = sorted({skill.strip().lower() for skill in required_skills})
+        placeholders = ", ".join(["%s"] * len(normalized))
         query = f"""
             SELECT DISTINCT u.*
             FROM users u
             INNER JOIN freelancer_skills fs ON u.user_id = fs.user_id
             WHERE u.user_type = 'freelancer'
-            AND fs.skill_name IN ({placeholders})
+            AND LOWER(fs.skill_name) IN ({placeholders})
             ORDER BY u.created_at DESC
         """
-        cursor.execute(query, tuple(required_skills))
+        cursor.execute(query, tuple(normalized))
         rows = cursor.fetchall()
-        return [_build_user(cursor, row) for row in rows]
+        return _build_users(cursor, rows)
 
 
 # --------------------------------------------------------------------------- #
@@ -139,12 +140,13 @@ def find_freelancers_by_skills(required_skills: List[str]) -> List[User]:
 # --------------------------------------------------------------------------- #
 
 
-def _build_user(cursor, row) -> User:
+def _build_user(cursor, row, skills: Optional[List[str]] = None) -> User:
     """Convert a database row plus related skills to a User dataclass."""
     if row is None:
         raise ValueError("Cannot build a user from an empty row.")
 
-    skills = _fetch_skills(cursor, row["user_id"])
+    if skills is None:
+        skills = _fetch_skills(cursor, row["user_id"])
 
     return User(
         user_id=row["user_id"],
@@ -167,6 +169,36 @@ def _fetch_skills(cursor, user_id: int) -> List[str]:
     return [record["skill_name"] for record in cursor.fetchall()]
 
 
+def _build_users(cursor, rows) -> List[User]:
+    """Build many users, loading all of their skills with one query."""
+    skills_by_user = _fetch_skills_for(cursor, [row["user_id"] for row in rows])
+    return [
+        _build_user(cursor, row, skills_by_user.get(row["user_id"], []))
+        for row in rows
+    ]
+
+
+def _fetch_skills_for(cursor, user_ids: Iterable[int]) -> Dict[int, List[str]]:
+    """Fetch skills for several users at once, keyed by user_id."""
+    user_ids = list(user_ids)
+    if not user_ids:
+        return {}
+
+    placeholders = ", ".join(["%s"] * len(user_ids))
+    cursor.execute(
+        f"""
+        SELECT user_id, skill_name FROM freelancer_skills
+        WHERE user_id IN ({placeholders})
+        ORDER BY skill_name ASC
+        """,
+        tuple(user_ids)
+    )
+    skills_by_user: Dict[int, List[str]] = {}
+    for record in cursor.fetchall():
+        skills_by_user.setdefault(record["user_id"], []).append(record["skill_name"])
+    return skills_by_user
+
+
 def _replace_skills(cursor, user_id: int, skills: List[str]) -> None:
     """Replace all skills for a user."""
     cursor.execute("DELETE FROM freelancer_skills WHERE user_id = %s", (user_id,))
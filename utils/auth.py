@@ -0,0 +1,28 @@
+"""Role checks shared by the CLI feature menus."""
+
+from functools import wraps
+from typing import Callable, Optional
+
+from utils.display import print_error
+
+
+def require_role(role: str, message: str, default_factory: Optional[Callable] = None):
+    """
+    Only run the wrapped function when `current_user` has the given role.
+
+    Otherwise print `message` and return `default_factory()` (or None).
+    The wrapped function must take `current_user` as its first argument.
+    """
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(current_user, *args, **kwargs):
+            user_type = current_user.get("user_type") if current_user else None
+            if user_type != role:
+                print_error(message)
+                return default_factory() if default_factory else None
+            return func(current_user, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
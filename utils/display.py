@@ -1,6 +1,11 @@
 import os
+import re
 import sys
 import getpass
+from itertools import chain
+
+# Terminal color escapes, which take no width on screen
+_ANSI_RE = re.compile(r'\x1b\[[0-9;]*m')
 
 class Display:
     """Display utilities for consistent CLI interface"""
@@ -94,15 +99,23 @@ class Display:
 
         Args:
             headers: List of column headers
-            rows: List of row data (list of lists)
-            column_widths: Optional list of column widths
+            rows: Row data (list of lists, or any iterable of rows)
+            column_widths: Optional list of column widths; when given, rows
+                are printed as they arrive instead of being collected first
+
+        Returns:
+            Number of rows printed
         """
-        if not rows:
+        rows = iter(rows)
+        first_row = next(rows, None)
+        if first_row is None:
             Display.print_warning("No data to display")
-            return
+            return 0
+        rows = chain((first_row,), rows)
 
         # Calculate column widths if not provided
         if column_widths is None:
+            rows = list(rows)
             column_widths = [len(str(h)) for h in headers]
             for row in rows:
                 for i, cell in enumerate(row):
@@ -118,13 +131,16 @@ class Display:
         print("-" * (sum(column_widths) + 3 * (len(headers) - 1)))
 
         # Print rows
+        count = 0
         for row in rows:
             row_line = " | ".join(
                 str(cell).ljust(w)
                 for cell, w in zip(row, column_widths)
             )
             print(row_line)
+            count += 1
         print()
+        return count
 
     @staticmethod
     def print_job_card(job):
@@ -326,6 +342,12 @@ class Display:
 
         return lines if lines else ['']
 
+    @staticmethod
+    def _pad(text, width):
+        """Pad text to a visible width, ignoring color escapes"""
+        visible = len(_ANSI_RE.sub('', text))
+        return text + ' ' * max(width - visible, 0)
+
     @staticmethod
     def _get_status_text(status):
         """Get colored status text"""
@@ -483,7 +505,7 @@ def ask_int(prompt, min_value=None, max_value=None):
 
 def print_table(headers, rows, column_widths=None):
     """Print data in table format (module-level alias)"""
-    Display.print_table(headers, rows, column_widths)
+    return Display.print_table(headers, rows, column_widths)
 
 
 def print_menu(title, options, show_back=True):
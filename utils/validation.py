@@ -4,6 +4,7 @@ import re
 from typing import List
 
 EMAIL_RE = re.compile(r"^[\w\.-]+@[\w\.-]+\.\w+$")
+NUMBER_RE = re.compile(r"^-?\d+(\.\d+)?$")
 ALLOWED_USER_TYPES = {"freelancer", "client"}
 
 